@@ -9,7 +9,10 @@ from starlette.responses import RedirectResponse
 from configs.config import jwt_settings
 from crud.user import crud_user
 from databases.database import get_async_session
-from security.password import verify_password
+from security.password import verify_and_update_password
+from security.token_cache import admin_token_cache
+from services.user import rehash_password
+from utilities.exceptions import PasswordHashQueueFullError
 from utilities.tokens import TokenSubject, create_tokens
 
 
@@ -21,13 +24,18 @@ class AdminAuth(AuthenticationBackend):
             found_user = await crud_user.get_by_username(db, username=username)
             if not found_user:
                 return False
-            if (
-                await verify_password(
+            try:
+                password_verified, new_hash = await verify_and_update_password(
                     plain_password=password,
                     hashed_password=found_user.hashed_password,
                 )
-                and found_user.is_admin
-            ):
+            except PasswordHashQueueFullError:
+                return False
+            if password_verified and new_hash:
+                await rehash_password(
+                    db=db, found_user=found_user, hashed_password=new_hash
+                )
+            if password_verified and found_user.is_admin:
                 subject = TokenSubject(uid=str(found_user.uid))
                 token = await create_tokens(subject)
                 request.session.update({"token": token.access_token})
@@ -46,8 +54,13 @@ class AdminAuth(AuthenticationBackend):
         if not token:
             return RedirectResponse("/admin/login")
         try:
-            user_uid = jwt.decode(
-                token, jwt_settings.JWT_SECRET_KEY, jwt_settings.JWT_ALGORITHM
+            user_uid = admin_token_cache.decode(
+                token,
+                lambda value: jwt.decode(
+                    value,
+                    jwt_settings.JWT_SECRET_KEY,
+                    jwt_settings.JWT_ALGORITHM,
+                ),
             )
             if user_uid is None:
                 return RedirectResponse("/admin/login")
@@ -1,8 +1,10 @@
 from typing import ClassVar
 
 from sqladmin import ModelView
+from starlette.requests import Request
 
 from models import Job
+from services.job_cache import JobParticipants, invalidate_job_lists
 
 
 class JobAdmin(ModelView, model=Job):
@@ -28,3 +30,20 @@ class JobAdmin(ModelView, model=Job):
         Job.author_id,
         Job.performer_id,
     ]
+
+    async def on_model_change(
+        self, data: dict, model: Job, is_created: bool, request: Request
+    ) -> None:
+        # The lists the job leaves if its author or performer changes
+        request.state.previous_job = JobParticipants(
+            model.author_id, model.performer_id
+        )
+
+    async def after_model_change(
+        self, data: dict, model: Job, is_created: bool, request: Request
+    ) -> None:
+        previous = [] if is_created else [request.state.previous_job]
+        await invalidate_job_lists([model, *previous])
+
+    async def after_model_delete(self, model: Job, request: Request) -> None:
+        await invalidate_job_lists([model])
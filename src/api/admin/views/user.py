@@ -1,8 +1,13 @@
 from typing import ClassVar
 
 from sqladmin import ModelView
+from starlette.requests import Request
 
+from crud.job import crud_job
+from databases.database import async_session
 from models import User
+from security.principal_cache import principal_cache
+from services.job_cache import invalidate_job_lists
 
 
 class UserAdmin(ModelView, model=User):
@@ -27,3 +32,21 @@ class UserAdmin(ModelView, model=User):
         User.username,
         User.email,
     ]
+
+    async def after_model_change(
+        self, data: dict, model: User, is_created: bool, request: Request
+    ) -> None:
+        # is_admin / is_deleted changes take effect on the next request
+        if not is_created:
+            await principal_cache.invalidate(model.uid)
+
+    async def on_model_delete(self, model: User, request: Request) -> None:
+        # The user's jobs go with them (ON DELETE CASCADE)
+        async with async_session() as db:
+            request.state.user_jobs = await crud_job.get_participants(
+                db, user_uid=model.uid
+            )
+
+    async def after_model_delete(self, model: User, request: Request) -> None:
+        await principal_cache.invalidate(model.uid)
+        await invalidate_job_lists(request.state.user_jobs)
@@ -1,32 +1,40 @@
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi_jwt import JwtAuthorizationCredentials
 from jose import JWTError
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.dependencies.database import get_async_db
 from crud.user import crud_user
-from databases.database import get_async_session
 from models import User
 from schemas.token import TokenPayload
+from security.principal_cache import principal_cache
+from security.revocation import token_revocations
 from security.token import access_security
 
 
 async def get_user(db: AsyncSession, user_uid: UUID) -> User:
+    if user := await principal_cache.get(user_uid):
+        return user
     user = await crud_user.get_by_uid(db, uid=user_uid)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    await principal_cache.set(user)
     return user
 
 
 async def get_current_user(
+    request: Request,
     credentials: JwtAuthorizationCredentials = Security(access_security),
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
-    if credentials is None:
+    if credentials is None or await token_revocations.is_revoked(
+        credentials.jti
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
         )
@@ -37,14 +45,18 @@ async def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         ) from ex
+    request.state.user_uid = token_user.uid
     return await get_user(db=db, user_uid=token_user.uid)
 
 
 async def get_admin(
+    request: Request,
     credentials: JwtAuthorizationCredentials = Security(access_security),
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
-    if credentials is None:
+    if credentials is None or await token_revocations.is_revoked(
+        credentials.jti
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
         )
@@ -55,6 +67,7 @@ async def get_admin(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         ) from ex
+    request.state.user_uid = token_user.uid
     user = await get_user(db=db, user_uid=token_user.uid)
     if not user.is_admin:
         raise HTTPException(
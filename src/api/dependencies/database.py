@@ -1,12 +1,96 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request, Security
+from fastapi_jwt import JwtAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from databases.database import async_session
+from configs.config import db_settings
+from configs.loggers import logger
+from databases.database import (
+    async_engine,
+    async_session,
+    replica_engine,
+    replica_session,
+)
+from databases.redis_pool import REDIS_FAILURES, redis_breaker
+from security.token import access_security
+from utilities.exceptions import CircuitOpenError
 
+PRIMARY_STICKY_KEY = "db-primary:{user_uid}"
 
-async def get_async_db() -> AsyncSession:
+
+async def get_async_db(request: Request) -> AsyncSession:
+    """
+    The request's primary session, shared by the auth dependencies and
+    the endpoint. A connection is checked out only on the first query.
+    """
     async with async_session() as session:
         try:
             yield session
         except Exception:
             await session.rollback()
             raise
+        user_uid = getattr(request.state, "user_uid", None)
+        if (
+            session.info.get("has_writes")
+            and user_uid
+            and replica_engine is not async_engine
+        ):
+            try:
+                await redis_breaker.call(
+                    request.app.state.redis.set,
+                    PRIMARY_STICKY_KEY.format(user_uid=user_uid),
+                    1,
+                    ex=db_settings.POSTGRES_PRIMARY_STICKINESS,
+                )
+            except (CircuitOpenError, *REDIS_FAILURES) as ex:
+                logger.exception(ex)
+
+
+async def reads_from_primary(
+    request: Request, credentials: JwtAuthorizationCredentials
+) -> bool:
+    """
+    True without a replica, or if the user wrote something in the last
+    POSTGRES_PRIMARY_STICKINESS seconds. Without Redis to tell, the
+    primary is the safe choice.
+    """
+    if replica_engine is async_engine:
+        return True
+    user_uid = credentials.subject.get("uid") if credentials else None
+    if not user_uid:
+        return False
+    try:
+        return bool(
+            await redis_breaker.call(
+                request.app.state.redis.exists,
+                PRIMARY_STICKY_KEY.format(user_uid=user_uid),
+            )
+        )
+    except (CircuitOpenError, *REDIS_FAILURES):
+        return True
+
+
+async def get_read_session_maker(
+    request: Request,
+    credentials: JwtAuthorizationCredentials = Security(access_security),
+) -> async_sessionmaker:
+    """Sessionmaker for read-only endpoints, see `reads_from_primary`."""
+    if await reads_from_primary(request, credentials):
+        return async_session
+    return replica_session
+
+
+async def get_read_db(
+    request: Request,
+    credentials: JwtAuthorizationCredentials = Security(access_security),
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncSession:
+    """
+    Session for read-only endpoints: the request's primary session when
+    reads go to the primary, so the request holds a single connection,
+    otherwise a replica session.
+    """
+    if await reads_from_primary(request, credentials):
+        yield db
+        return
+    async with replica_session() as session:
+        yield session
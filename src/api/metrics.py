@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+from starlette.responses import Response
+
+from api.dependencies.auth import get_admin
+from utilities.metrics import CONTENT_TYPE_LATEST, render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", dependencies=[Depends(get_admin)])
+async def metrics() -> Response:
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,139 @@
+import inspect
+from functools import wraps
+from inspect import Parameter
+from typing import Any, Callable, Optional, Type
+
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+
+from utilities.serialization import RawJSON, dumps_json, type_adapter
+
+# Route options FastAPI applies while serializing, with their defaults;
+# routes that change one are serialized by FastAPI itself
+SERIALIZATION_OPTIONS = {
+    "response_model_include": None,
+    "response_model_exclude": None,
+    "response_model_by_alias": True,
+    "response_model_exclude_unset": False,
+    "response_model_exclude_defaults": False,
+    "response_model_exclude_none": False,
+}
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson that sends already encoded
+    `RawJSON` content as is."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, RawJSON):
+            return content
+        return dumps_json(content)
+
+
+def render_json(response_model: Any, value: Any) -> RawJSON:
+    """
+    `value`, ORM rows included, validated against `response_model` and
+    dumped to JSON in one pass of its shared TypeAdapter.
+    """
+    adapter = type_adapter(response_model)
+    return RawJSON(
+        adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    )
+
+
+def fast_json_endpoint(
+    endpoint: Callable[..., Any],
+    response_model: Any,
+    response_class: Type[FastJSONResponse],
+    status_code: Optional[int],
+) -> Callable[..., Any]:
+    """
+    `endpoint` returning a `response_class` rendered with `render_json`.
+    Headers and the status code set on the injected Response are kept,
+    and Response results, such as 304 Not Modified, are returned as is.
+    """
+    response_param = Parameter(
+        "__fast_json_response", Parameter.KEYWORD_ONLY, annotation=Response
+    )
+    signature = inspect.signature(endpoint)
+    # FastAPI passes the same Response to every parameter annotated with
+    # it, so share the one `@cache` or `conditional` may have injected
+    located = next(
+        (
+            param
+            for param in signature.parameters.values()
+            if param.annotation is Response
+        ),
+        None,
+    )
+
+    @wraps(endpoint)
+    async def inner(*args: Any, **kwargs: Any) -> Any:
+        if located is None:
+            response = kwargs.pop(response_param.name)
+        else:
+            response = kwargs[located.name]
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        fast_response = response_class(
+            render_json(response_model, result),
+            status_code=response.status_code or status_code or 200,
+        )
+        fast_response.raw_headers.extend(response.headers.raw)
+        return fast_response
+
+    if located is None:
+        signature = signature.replace(
+            parameters=[*signature.parameters.values(), response_param]
+        )
+    inner.__signature__ = signature
+    inner.__fast_json__ = True
+    return inner
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route that validates the endpoint's result against `response_model`
+    and dumps it to JSON in the same Rust pass, when its response class
+    is a FastJSONResponse. The endpoint then returns the response itself,
+    so FastAPI does not validate and encode the result again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        endpoint: Callable[..., Any],
+        *,
+        response_model: Any = Default(None),
+        status_code: Optional[int] = None,
+        response_class: Any = Default(JSONResponse),
+        **kwargs: Any,
+    ) -> None:
+        rendered_by = response_class
+        if isinstance(rendered_by, DefaultPlaceholder):
+            rendered_by = rendered_by.value
+        if (
+            not isinstance(response_model, DefaultPlaceholder)
+            and response_model is not None
+            and issubclass(rendered_by, FastJSONResponse)
+            and inspect.iscoroutinefunction(endpoint)
+            and not getattr(endpoint, "__fast_json__", False)
+            and all(
+                kwargs.get(option, default) == default
+                for option, default in SERIALIZATION_OPTIONS.items()
+            )
+        ):
+            endpoint = fast_json_endpoint(
+                endpoint, response_model, rendered_by, status_code
+            )
+        super().__init__(
+            path,
+            endpoint,
+            response_model=response_model,
+            status_code=status_code,
+            response_class=response_class,
+            **kwargs,
+        )
@@ -4,18 +4,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse, Response
 
 from api.dependencies.database import get_async_db
+from api.responses import FastJSONRoute
 from crud.user import crud_user
+from configs.config import jwt_settings
+from databases.redis_pool import REDIS_FAILURES
+from security.revocation import token_revocations
+from services.user import rehash_password
 from schemas.token import TokenAccessRefresh, UserLogin
-from security.password import verify_password
+from security.password import verify_and_update_password
 from security.token import (
     ACCESS_TOKEN_COOKIE_KEY,
     REFRESH_TOKEN_COOKIE_KEY,
     access_security,
     refresh_security,
 )
+from utilities.exceptions import CircuitOpenError, PasswordHashQueueFullError
 from utilities.tokens import create_tokens, set_tokens_to_cookie
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/login/", response_model=TokenAccessRefresh)
@@ -29,15 +35,26 @@ async def login(
             detail=f"User {user_login.email} not found.",
         )
 
-    password_verified = await verify_password(
-        plain_password=user_login.password,
-        hashed_password=found_user.hashed_password,
-    )
+    try:
+        password_verified, new_hash = await verify_and_update_password(
+            plain_password=user_login.password,
+            hashed_password=found_user.hashed_password,
+        )
+    except PasswordHashQueueFullError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts, try again later.",
+            headers={"Retry-After": "1"},
+        ) from ex
     if not password_verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User password is wrong",
         )
+    if new_hash:
+        await rehash_password(
+            db=db, found_user=found_user, hashed_password=new_hash
+        )
 
     tokens = await create_tokens(subject={"uid": str(found_user.uid)})
     response = JSONResponse(content=tokens.model_dump())
@@ -48,6 +65,22 @@ async def login(
 async def refresh(
     credentials: JwtAuthorizationCredentials = Security(refresh_security),
 ):
+    try:
+        redeemed = credentials.jti is not None and (
+            await token_revocations.redeem(
+                credentials.jti,
+                expires_in=jwt_settings.JWT_REFRESH_TOKEN_EXPIRES * 60,
+            )
+        )
+    except (CircuitOpenError, *REDIS_FAILURES) as ex:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token revocation is unavailable, try again later.",
+        ) from ex
+    if not redeemed:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
+        )
     return await create_tokens(credentials.subject)
 
 
@@ -55,6 +88,23 @@ async def refresh(
 async def logout(
     credentials: JwtAuthorizationCredentials = Security(access_security),
 ):
+    """Revokes the access token and the refresh token issued with it."""
+    try:
+        if credentials.jti:
+            await token_revocations.revoke(
+                credentials.jti,
+                expires_in=jwt_settings.JWT_ACCESS_TOKEN_EXPIRES * 60,
+            )
+        if refresh_jti := credentials.subject.get("refresh_jti"):
+            await token_revocations.revoke_refresh(
+                refresh_jti,
+                expires_in=jwt_settings.JWT_REFRESH_TOKEN_EXPIRES * 60,
+            )
+    except (CircuitOpenError, *REDIS_FAILURES) as ex:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token revocation is unavailable, try again later.",
+        ) from ex
     response = Response()
     response.delete_cookie(ACCESS_TOKEN_COOKIE_KEY)
     response.delete_cookie(REFRESH_TOKEN_COOKIE_KEY)
@@ -1,25 +1,52 @@
 import uuid
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, status, Depends, HTTPException
-from fastapi_cache.decorator import cache
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.responses import StreamingResponse
 
+from cache import cache, compact_coder, conditional, tagged_key_builder
+from configs.config import cache_settings
 from configs.loggers import logger
-from api.dependencies.database import get_async_db
+from constants.job import MAX_BULK_JOBS, BulkItemStatus, ExportFormat
+from api.dependencies.database import (
+    get_async_db,
+    get_read_db,
+    get_read_session_maker,
+)
 from api.dependencies.auth import get_current_user, get_admin
+from api.responses import FastJSONRoute
 from crud.job import crud_job
+from crud.user import crud_user
 from models.user import User
+from services.job_cache import (
+    all_jobs_tags,
+    author_jobs_tags,
+    author_jobs_version,
+    invalidate_job_lists,
+    job_version,
+    performer_jobs_tags,
+    performer_jobs_version,
+)
+from services.job_export import EXPORT_MEDIA_TYPES, export_jobs
 from schemas.job import (
     JobResponse,
     JobCreate,
     JobUpdate,
     JobUpdateForPerformer,
     JobCreateDB,
+    JobPage,
+    JobBulkUpdate,
+    JobBulkResult,
+)
+from utilities.exceptions import (
+    InvalidCursorError,
+    ObjectNotFoundError,
+    PermissionDeniedError,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get(
@@ -27,9 +54,14 @@ router = APIRouter()
     response_model=List[JobResponse],
     status_code=status.HTTP_200_OK,
 )
-@cache(expire=60)
+@conditional(author_jobs_version)
+@cache(
+    expire=cache_settings.JOB_LIST_CACHE_TTL,
+    coder=compact_coder(List[JobResponse]),
+    key_builder=tagged_key_builder(author_jobs_tags),
+)
 async def get_author_jobs(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return await crud_job.get_by_author_id(db=db, author_id=current_user.id)
@@ -40,9 +72,14 @@ async def get_author_jobs(
     response_model=List[JobResponse],
     status_code=status.HTTP_200_OK,
 )
-@cache(expire=60)
+@conditional(performer_jobs_version)
+@cache(
+    expire=cache_settings.JOB_LIST_CACHE_TTL,
+    coder=compact_coder(List[JobResponse]),
+    key_builder=tagged_key_builder(performer_jobs_tags),
+)
 async def get_performer_jobs(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return await crud_job.get_by_performer_id(
@@ -51,9 +88,13 @@ async def get_performer_jobs(
 
 
 @router.get("/all/", response_model=List[JobResponse])
-@cache(expire=60)
+@cache(
+    expire=cache_settings.JOB_LIST_CACHE_TTL,
+    coder=compact_coder(List[JobResponse]),
+    key_builder=tagged_key_builder(all_jobs_tags),
+)
 async def get_all_jobs(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     limit: int = 100,
     skip: int = 0,
@@ -61,14 +102,70 @@ async def get_all_jobs(
     return await crud_job.get_all(db=db, limit=limit, skip=skip)
 
 
+@router.get("/page/", response_model=JobPage)
+@cache(
+    expire=cache_settings.JOB_LIST_CACHE_TTL,
+    coder=compact_coder(JobPage),
+    key_builder=tagged_key_builder(all_jobs_tags),
+)
+async def get_jobs_page(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    try:
+        jobs, next_cursor = await crud_job.get_page(
+            db=db, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor {cursor}.",
+        ) from ex
+
+    return JobPage.model_validate(
+        {"items": jobs, "next_cursor": next_cursor}, from_attributes=True
+    )
+
+
+@router.get("/export/", response_class=StreamingResponse)
+async def export_all_jobs(
+    session_maker: async_sessionmaker = Depends(get_read_session_maker),
+    current_user: User = Depends(get_current_user),
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    author_id: Optional[int] = None,
+    performer_id: Optional[int] = None,
+    is_archived: Optional[bool] = None,
+    is_completed: Optional[bool] = None,
+):
+    return StreamingResponse(
+        export_jobs(
+            session_maker,
+            export_format,
+            author_id=author_id,
+            performer_id=performer_id,
+            is_archived=is_archived,
+            is_completed=is_completed,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="jobs.{export_format}"'
+            )
+        },
+    )
+
+
 @router.get(
     "/{job_uid}/",
     response_model=JobResponse,
     status_code=status.HTTP_200_OK,
 )
+@conditional(job_version)
 async def get_job_by_uid(
     job_uid: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     found_job = await crud_job.get_by_uid(db=db, uid=job_uid)
@@ -78,7 +175,7 @@ async def get_job_by_uid(
             detail=f"Job {job_uid} not found.",
         )
 
-    return await crud_job.get_by_uid(db=db, uid=job_uid)
+    return found_job
 
 
 @router.post(
@@ -111,9 +208,60 @@ async def create_job(
             detail="An error occurred while creating the job.",
         ) from ex
 
+    await invalidate_job_lists([new_job])
     return new_job
 
 
+@router.post(
+    "/bulk/",
+    response_model=List[JobResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_jobs_bulk(
+    create_data: List[JobCreate],
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    if len(create_data) > MAX_BULK_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {MAX_BULK_JOBS} jobs per request.",
+        )
+
+    performer_ids = {job.performer_id for job in create_data}
+    found_ids = await crud_user.get_existing_ids(db=db, obj_ids=performer_ids)
+    if missing_ids := performer_ids - found_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Performers {sorted(missing_ids)} not found.",
+        )
+
+    try:
+        new_jobs = await crud_job.create_many(
+            db=db,
+            create_schemas=[
+                JobCreateDB(
+                    uid=uuid.uuid4(),
+                    author_id=current_user.id,
+                    **job.model_dump(exclude_unset=True),
+                )
+                for job in create_data
+            ],
+            commit=False,
+        )
+        await db.commit()
+    except Exception as ex:
+        await db.rollback()
+        logger.exception(ex)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while creating the jobs.",
+        ) from ex
+
+    await invalidate_job_lists(new_jobs)
+    return new_jobs
+
+
 @router.patch(
     "/author/{job_uid}/",
     response_model=JobResponse,
@@ -125,24 +273,100 @@ async def update_job_for_author(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    found_job = await crud_job.get_by_uid(db=db, uid=job_uid)
-    if not found_job:
+    try:
+        (
+            updated_job,
+            previous_performer_id,
+        ) = await crud_job.update_by_uid_with_previous(
+            db=db,
+            uid=job_uid,
+            update_data=update_data,
+            previous_field="performer_id",
+            owner_field="author_id",
+            owner_id=current_user.id,
+        )
+    except ObjectNotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_uid} not found.",
-        )
-    if found_job.author_id != current_user.id:
+        ) from ex
+    except PermissionDeniedError as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not permission to update this job",
+        ) from ex
+
+    await invalidate_job_lists([updated_job], [previous_performer_id])
+    return updated_job
+
+
+@router.patch(
+    "/admin/bulk/",
+    response_model=List[JobBulkResult],
+    status_code=status.HTTP_200_OK,
+)
+async def update_jobs_bulk_for_admin(
+    update_data: List[JobBulkUpdate],
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_admin),
+):
+    if len(update_data) > MAX_BULK_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {MAX_BULK_JOBS} jobs per request.",
+        )
+    job_uids = [job.uid for job in update_data]
+    if len(set(job_uids)) != len(job_uids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Job uids must be unique.",
         )
 
-    return await crud_job.update(
-        db=db,
-        db_obj=found_job,
-        update_data=update_data,
+    performer_ids = {job.performer_id for job in update_data} - {None}
+    if performer_ids:
+        found_ids = await crud_user.get_existing_ids(
+            db=db, obj_ids=performer_ids
+        )
+        if missing_ids := performer_ids - found_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Performers {sorted(missing_ids)} not found.",
+            )
+    previous_performer_ids = (
+        await crud_job.get_performer_ids(
+            db=db,
+            uids=[job.uid for job in update_data if job.performer_id],
+        )
+        if performer_ids
+        else {}
     )
 
+    try:
+        updated_jobs = await crud_job.update_many(
+            db=db, update_data=update_data, key_field="uid", commit=False
+        )
+        await db.commit()
+    except Exception as ex:
+        await db.rollback()
+        logger.exception(ex)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while updating the jobs.",
+        ) from ex
+
+    await invalidate_job_lists(updated_jobs, previous_performer_ids.values())
+    updated_by_uid = {job.uid: job for job in updated_jobs}
+    return [
+        {
+            "uid": job_uid,
+            "status": BulkItemStatus.updated
+            if job_uid in updated_by_uid
+            else BulkItemStatus.not_found,
+            "job": updated_by_uid.get(job_uid),
+        }
+        for job_uid in job_uids
+    ]
+
 
 @router.patch(
     "/admin/{job_uid}/",
@@ -155,18 +379,24 @@ async def update_job_for_admin(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_admin),
 ):
-    found_job = await crud_job.get_by_uid(db=db, uid=job_uid)
-    if not found_job:
+    try:
+        (
+            updated_job,
+            previous_performer_id,
+        ) = await crud_job.update_by_uid_with_previous(
+            db=db,
+            uid=job_uid,
+            update_data=update_data,
+            previous_field="performer_id",
+        )
+    except ObjectNotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_uid} not found.",
-        )
+        ) from ex
 
-    return await crud_job.update(
-        db=db,
-        db_obj=found_job,
-        update_data=update_data,
-    )
+    await invalidate_job_lists([updated_job], [previous_performer_id])
+    return updated_job
 
 
 @router.patch(
@@ -180,24 +410,91 @@ async def update_job_for_performer(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    found_job = await crud_job.get_by_uid(db=db, uid=job_uid)
-    if not found_job:
+    try:
+        updated_job = await crud_job.update_by_uid(
+            db=db,
+            uid=job_uid,
+            update_data=update_data,
+            owner_field="performer_id",
+            owner_id=current_user.id,
+        )
+    except ObjectNotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_uid} not found.",
-        )
-    if found_job.performer_id != current_user.id:
+        ) from ex
+    except PermissionDeniedError as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not permission to update this job",
+        ) from ex
+
+    await invalidate_job_lists([updated_job])
+    return updated_job
+
+
+@router.delete(
+    "/bulk/",
+    response_model=List[JobBulkResult],
+    status_code=status.HTTP_200_OK,
+)
+async def delete_jobs_bulk(
+    job_uids: List[UUID],
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    if len(job_uids) > MAX_BULK_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {MAX_BULK_JOBS} jobs per request.",
         )
+    job_uids = list(dict.fromkeys(job_uids))
+    owner_filter = (
+        {}
+        if current_user.is_admin
+        else {"owner_field": "author_id", "owner_id": current_user.id}
+    )
 
-    return await crud_job.update(
-        db=db,
-        db_obj=found_job,
-        update_data=update_data,
+    try:
+        deleted_jobs = await crud_job.remove_many(
+            db=db,
+            obj_ids=job_uids,
+            key_field="uid",
+            commit=False,
+            **owner_filter,
+        )
+        await db.commit()
+    except Exception as ex:
+        await db.rollback()
+        logger.exception(ex)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while deleting the jobs.",
+        ) from ex
+
+    await invalidate_job_lists(deleted_jobs)
+    deleted_uids = {job.uid for job in deleted_jobs}
+    remaining_uids = [uid for uid in job_uids if uid not in deleted_uids]
+    existing_uids = (
+        await crud_job.get_existing_ids(
+            db=db, obj_ids=remaining_uids, key_field="uid"
+        )
+        if remaining_uids and owner_filter
+        else set()
     )
 
+    def item_status(job_uid: UUID) -> BulkItemStatus:
+        if job_uid in deleted_uids:
+            return BulkItemStatus.deleted
+        if job_uid in existing_uids:
+            return BulkItemStatus.forbidden
+        return BulkItemStatus.not_found
+
+    return [
+        {"uid": job_uid, "status": item_status(job_uid)}
+        for job_uid in job_uids
+    ]
+
 
 @router.delete("/{job_uid}/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
@@ -205,16 +502,24 @@ async def delete_job(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    found_job = await crud_job.get_by_uid(db=db, uid=job_uid)
-    if not found_job:
+    owner_filter = (
+        {}
+        if current_user.is_admin
+        else {"owner_field": "author_id", "owner_id": current_user.id}
+    )
+    try:
+        deleted_job = await crud_job.remove_by_uid(
+            db=db, uid=job_uid, **owner_filter
+        )
+    except ObjectNotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_uid} not found.",
-        )
-    if found_job.author_id == current_user.id or current_user.is_admin:
-        await crud_job.remove(db=db, obj_id=found_job.id)
-    else:
+        ) from ex
+    except PermissionDeniedError as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not permission to delete this job",
-        )
+        ) from ex
+
+    await invalidate_job_lists([deleted_job])
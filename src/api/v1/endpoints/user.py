@@ -1,12 +1,13 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, status, HTTPException, Depends
-from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies.database import get_async_db
+from api.dependencies.database import get_async_db, get_read_db
 from api.dependencies.auth import get_current_user, get_admin
+from api.responses import FastJSONRoute
+from cache import cache, compact_coder
 from models import User
 from schemas.user import (
     UserResponse,
@@ -14,12 +15,22 @@ from schemas.user import (
     UserUpdateFullDB,
     UserUpdateDB,
     UserForAdminResponse,
+    UserPage,
 )
 from services import user
+from services.job_cache import invalidate_job_lists
+from crud.job import crud_job
 from crud.user import crud_user
-from utilities.exceptions import UserNameExistError
+from security.principal_cache import principal_cache
+from utilities.exceptions import (
+    InvalidCursorError,
+    ObjectNotFoundError,
+    PasswordHashQueueFullError,
+    PermissionDeniedError,
+    UserNameExistError,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get(
@@ -38,9 +49,9 @@ async def get_account_for_user(
     response_model=List[UserResponse],
     status_code=status.HTTP_200_OK,
 )
-@cache(expire=60)
+@cache(expire=60, coder=compact_coder(List[UserResponse]))
 async def get_all_users(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     limit: int = 100,
     skip: int = 0,
@@ -52,6 +63,33 @@ async def get_all_users(
     )
 
 
+@router.get(
+    "/page/",
+    response_model=UserPage,
+    status_code=status.HTTP_200_OK,
+)
+@cache(expire=60, coder=compact_coder(UserPage))
+async def get_users_page(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    try:
+        users, next_cursor = await crud_user.get_page(
+            db=db, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor {cursor}.",
+        ) from ex
+
+    return UserPage.model_validate(
+        {"items": users, "next_cursor": next_cursor}, from_attributes=True
+    )
+
+
 @router.get(
     "/{user_uid}/",
     response_model=UserResponse,
@@ -59,7 +97,7 @@ async def get_all_users(
 )
 async def get_user_by_uid(
     user_uid: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     if found_user := await crud_user.get_by_uid(db=db, uid=user_uid):
@@ -86,7 +124,14 @@ async def create_user(
             detail=f"A user with this {create_data.email}, "
             f"already exists.",
         )
-    return await user.create_user(db=db, create_data=create_data)
+    try:
+        return await user.create_user(db=db, create_data=create_data)
+    except PasswordHashQueueFullError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-ups, try again later.",
+            headers={"Retry-After": "1"},
+        ) from ex
 
 
 @router.patch(
@@ -148,16 +193,30 @@ async def delete_user(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    found_user = await crud_user.get_by_uid(db=db, uid=user_uid)
-    if not found_user:
+    is_admin = current_user.is_admin is True
+    owner_filter = (
+        {}
+        if is_admin
+        else {"owner_field": "uid", "owner_id": current_user.uid}
+    )
+    # The user's jobs go with them (ON DELETE CASCADE). Only read them
+    # once the caller may delete the user; the DELETE checks again.
+    jobs = (
+        await crud_job.get_participants(db, user_uid=user_uid)
+        if is_admin or user_uid == current_user.uid
+        else []
+    )
+    try:
+        await crud_user.remove_by_uid(db=db, uid=user_uid, **owner_filter)
+    except ObjectNotFoundError as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found.",
-        )
-    if found_user.uid == current_user.uid or current_user.is_admin is True:
-        await crud_user.remove(db=db, obj_id=found_user.id)
-    else:
+        ) from ex
+    except PermissionDeniedError as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to delete this user.",
-        )
+        ) from ex
+    await principal_cache.invalidate(user_uid)
+    await invalidate_job_lists(jobs)
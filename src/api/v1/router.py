@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 
+from api.responses import FastJSONResponse
 from api.v1.endpoints.user import router as user_router
 from api.v1.endpoints.auth import router as auth_router
 from api.v1.endpoints.job import router as job_router
 
-router = APIRouter(prefix="/v1")
+router = APIRouter(prefix="/v1", default_response_class=FastJSONResponse)
 
 router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 router.include_router(user_router, prefix="/user", tags=["User"])
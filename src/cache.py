@@ -1,14 +1,756 @@
+import asyncio
+import hashlib
+import inspect
+import time
+import zlib
+from contextlib import suppress
+from contextvars import ContextVar
+from functools import partial, wraps
+from inspect import Parameter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from fastapi.encoders import jsonable_encoder
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder, JsonCoder
+from fastapi_cache.decorator import cache as cache_response
+from fastapi_cache.types import KeyBuilder
+from pydantic import TypeAdapter
 from redis import asyncio as aioredis
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from configs.config import cache_settings, db_settings
+from configs.loggers import logger
+from databases.redis_pool import REDIS_FAILURES, redis_breaker
+from utilities.circuit_breaker import CircuitBreaker
+from utilities.exceptions import CircuitOpenError
+from utilities.lru import TTLCache
+from utilities.metrics import Counter
+from utilities.pubsub import subscribe
+from utilities.serialization import dumps_json, loads_json, type_adapter
+
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Awaitable[Any]])
+
+TAG_KEY = "{prefix}:tag:{tag}"
+GENERATION_KEY = "{prefix}:tag:{tag}:generation"
+LOCK_KEY = "{key}:lock"
+CACHE_INVALIDATION_CHANNEL = "cache-invalidation"
+ALL_KEYS = "*"
+
+# Stamps every tag's generation key with the time of its last purge, so
+# refills that read the database before it can tell (see STORE_ENTRY_SCRIPT)
+INVALIDATE_TAGS_SCRIPT = """
+local count = #KEYS / 2
+local time = redis.call('TIME')
+local now = time[1] * 1000000 + time[2]
+local deleted = {}
+for i = 1, count do
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+        redis.call('DEL', key)
+        table.insert(deleted, key)
+    end
+    redis.call('DEL', KEYS[i])
+    local previous = tonumber(redis.call('GET', KEYS[count + i])) or 0
+    local generation = math.max(now, previous + 1)
+    redis.call(
+        'SET', KEYS[count + i], string.format('%.0f', generation),
+        'PX', ARGV[1]
+    )
+end
+return deleted
+"""
+
+# KEYS: entry, lock, tags..., generations...
+# ARGV: value, expire, stale_ttl, settle_ttl, generations the refill saw...
+# Returns -1 without storing when a tag was purged since the refill began,
+# else the expire used: capped to settle_ttl right after a purge, when the
+# refill may have read a replica that had not caught up with the write.
+STORE_ENTRY_SCRIPT = """
+local count = (#KEYS - 2) / 2
+local time = redis.call('TIME')
+local now = time[1] * 1000000 + time[2]
+local expire = tonumber(ARGV[2])
+local settle = tonumber(ARGV[4])
+redis.call('DEL', KEYS[2])
+for i = 1, count do
+    local generation = redis.call('GET', KEYS[2 + count + i]) or ''
+    local seen = ARGV[4 + i]
+    if seen ~= nil and generation ~= seen then
+        return -1
+    end
+    if generation ~= '' and now - tonumber(generation) < settle * 1000000
+    then
+        if expire == 0 or expire > settle then
+            expire = settle
+        end
+    end
+end
+local redis_expire = expire + tonumber(ARGV[3])
+if expire > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', redis_expire)
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+for i = 1, count do
+    redis.call('SADD', KEYS[2 + i], KEYS[1])
+    if expire > 0 then
+        redis.call('EXPIRE', KEYS[2 + i], redis_expire)
+    end
+end
+return expire
+"""
+
+Compressor = Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+# First byte of an encoded entry, never a valid first byte of JSON, so
+# entries written by fastapi-cache's JsonCoder still decode.
+CODEC_HEADERS = {
+    "none": b"\x00",
+    "zlib": b"\x01",
+}
+COMPRESSORS: Dict[bytes, Compressor] = {
+    CODEC_HEADERS["zlib"]: (partial(zlib.compress, level=1), zlib.decompress),
+}
+
+entry_tags: ContextVar[Tuple[str, ...]] = ContextVar(
+    "cache_entry_tags", default=()
+)
+# Version `conditional` built the ETag from, part of the entry's key
+entry_version: ContextVar[Any] = ContextVar(
+    "cache_entry_version", default=None
+)
+# Key whose refill this request owns until `set` stores the entry
+refill_lease: ContextVar[Optional[str]] = ContextVar(
+    "cache_refill_lease", default=None
+)
+# Generations of the entry's tags when its lookup missed, checked by `set`
+refill_generations: ContextVar[Optional[Tuple[str, ...]]] = ContextVar(
+    "cache_refill_generations", default=None
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Response cache lookups per endpoint",
+    ["endpoint", "result"],
+)
+CACHE_TIER_REQUESTS = Counter(
+    "cache_tier_requests_total",
+    "Response cache lookups per tier",
+    ["tier", "result"],
+)
+CACHE_COALESCED = Counter(
+    "cache_coalesced_total",
+    "Cache misses that did not recompute the response",
+    ["mode"],
+)
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    `{namespace}:{endpoint}:{user uid}:{digest of path and query}`.
+    Injected dependencies such as the session are not part of the key;
+    the `conditional` version, when there is one, is.
+    """
+    current_user = kwargs.get("current_user")
+    user_uid = current_user.uid if current_user else "anonymous"
+    params = ""
+    if request is not None:
+        query = sorted(request.query_params.multi_items())
+        params = f"{request.url.path}?{query}"
+    if (version := entry_version.get()) is not None:
+        params = f"{params}#{version}"
+    digest = hashlib.md5(params.encode()).hexdigest()
+    return f"{namespace}:{func.__name__}:{user_uid}:{digest}"
+
+
+def tagged_key_builder(tags: Callable[..., Iterable[str]]) -> KeyBuilder:
+    """
+    `request_key_builder` that also tags the entry being looked up with
+    `tags(**endpoint kwargs)`, so `invalidate_tags` can purge it.
+    """
+
+    def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        entry_tags.set(tuple(tags(**kwargs)))
+        return request_key_builder(
+            func,
+            namespace,
+            request=request,
+            response=response,
+            args=args,
+            kwargs=kwargs,
+        )
+
+    return key_builder
+
+
+def make_etag(key: str, version: Any) -> str:
+    digest = hashlib.md5(f"{key}:{version}".encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of `etag` against the request's If-None-Match."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {
+        value.strip().removeprefix("W/") for value in header.split(",")
+    }
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def conditional(
+    version: Callable[..., Awaitable[Any]],
+) -> Callable[[Endpoint], Endpoint]:
+    """
+    ETag from `version(**endpoint kwargs)` and the `request_key_builder`
+    key, so it differs per user and query. A matching If-None-Match gets
+    304 Not Modified before the response cache or the endpoint run.
+    When `version` returns None the request is served unconditionally.
+    Goes above `@cache`, whose per-process ETag it replaces. The version
+    is also part of the cache key, so a body cached before a write is
+    never served under the ETag of a later version.
+    """
+    request_param = Parameter(
+        "__conditional_request", Parameter.KEYWORD_ONLY, annotation=Request
+    )
+    response_param = Parameter(
+        "__conditional_response", Parameter.KEYWORD_ONLY, annotation=Response
+    )
+
+    def wrapper(func: Endpoint) -> Endpoint:
+        signature = inspect.signature(func)
+        # FastAPI fills one Request and one Response parameter per
+        # endpoint, so share the ones `@cache` may have injected already.
+        located = [
+            next(
+                (
+                    param
+                    for param in signature.parameters.values()
+                    if param.annotation is default.annotation
+                ),
+                default,
+            )
+            for default in (request_param, response_param)
+        ]
+        injected = [
+            param
+            for param in located
+            if param in (request_param, response_param)
+        ]
+        request_name, response_name = (param.name for param in located)
+
+        @wraps(func)
+        async def inner(*args: Any, **kwargs: Any) -> Any:
+            request = kwargs[request_name]
+            response = kwargs[response_name]
+            for param in injected:
+                del kwargs[param.name]
+            current = await version(**kwargs)
+            if current is None:
+                return await func(*args, **kwargs)
+
+            key = request_key_builder(
+                func, request=request, args=args, kwargs=kwargs
+            )
+            etag = make_etag(key, current)
+            if etag_matches(request, etag):
+                return Response(
+                    status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+            token = entry_version.set(current)
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                entry_version.reset(token)
+            response.headers["ETag"] = etag
+            return result
+
+        inner.__signature__ = signature.replace(
+            parameters=[*signature.parameters.values(), *injected]
+        )
+        return inner
+
+    return wrapper
+
+
+def cache(**kwargs: Any) -> Callable[[Endpoint], Endpoint]:
+    """
+    fastapi-cache's `cache`, except that a failing endpoint gives up the
+    refill of its key, so identical requests recompute it right away
+    instead of waiting for the lease to expire.
+    """
+
+    def wrapper(func: Endpoint) -> Endpoint:
+        cached = cache_response(**kwargs)(func)
+
+        @wraps(cached)
+        async def inner(*args: Any, **kwargs: Any) -> Any:
+            token = refill_lease.set(None)
+            generations_token = refill_generations.set(None)
+            try:
+                return await cached(*args, **kwargs)
+            except BaseException:
+                if (key := refill_lease.get()) is not None:
+                    await FastAPICache.get_backend().release(key)
+                raise
+            finally:
+                refill_lease.reset(token)
+                refill_generations.reset(generations_token)
+
+        return inner
+
+    return wrapper
+
+
+def tag_key(tag: str) -> str:
+    return TAG_KEY.format(prefix=FastAPICache.get_prefix(), tag=tag)
+
+
+def generation_key(tag: str) -> str:
+    return GENERATION_KEY.format(prefix=FastAPICache.get_prefix(), tag=tag)
+
+
+def key_endpoint(key: str) -> str:
+    return key.rsplit(":", 3)[1]
 
-from configs.config import redis_settings
 
+class CompactCoder(Coder):
+    """
+    Compact JSON coder for cached responses. Entries are dumped through
+    `adapter`, so only the fields of the response model are stored, and
+    compressed once they reach `threshold` bytes. Without an adapter the
+    whole value is stored, so endpoints returning ORM rows must pass
+    their response model to `compact_coder`. Hits are validated
+    from the stored JSON in one pass, so FastAPI gets model instances.
+    Use `compact_coder` to configure it per endpoint.
+    """
 
-async def start_cache() -> None:
-    redis = aioredis.from_url(
-        f"redis://{redis_settings.REDIS_HOST}",
-        encoding="utf8",
-        decode_responses=False,
+    adapter: Optional[TypeAdapter] = None
+    compression = "zlib"
+    threshold = 1024
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if cls.adapter is None:
+            data = dumps_json(jsonable_encoder(value))
+        else:
+            data = cls.adapter.dump_json(
+                cls.adapter.validate_python(value, from_attributes=True)
+            )
+        header = CODEC_HEADERS[cls.compression]
+        if header not in COMPRESSORS or len(data) < cls.threshold:
+            return CODEC_HEADERS["none"] + data
+        compress, _ = COMPRESSORS[header]
+        return header + compress(data)
+
+    @staticmethod
+    def unpack(value: bytes) -> Optional[bytes]:
+        """The stored JSON, or None for entries written by JsonCoder."""
+        header, data = value[:1], value[1:]
+        if header == CODEC_HEADERS["none"]:
+            return data
+        if header in COMPRESSORS:
+            _, decompress = COMPRESSORS[header]
+            return decompress(data)
+        return None
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        data = cls.unpack(value)
+        if data is None:
+            return JsonCoder.decode(value)
+        return loads_json(data)
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Any:  # noqa: ARG003
+        data = cls.unpack(value)
+        if cls.adapter is None or data is None:
+            return cls.decode(value)
+        return cls.adapter.validate_json(data)
+
+
+def compact_coder(
+    response_model: Any = None,
+    *,
+    compression: str = cache_settings.RESPONSE_CACHE_COMPRESSION,
+    threshold: int = cache_settings.RESPONSE_CACHE_COMPRESSION_THRESHOLD,
+) -> Type[CompactCoder]:
+    """
+    `CompactCoder` storing `response_model` compressed with `compression`
+    (`none` or `zlib`) above `threshold`.
+    """
+    if compression not in CODEC_HEADERS:
+        msg = f"Unknown cache compression {compression}"
+        raise ValueError(msg)
+    adapter = None if response_model is None else type_adapter(response_model)
+    return type(
+        "CompactCoder",
+        (CompactCoder,),
+        {
+            "adapter": adapter,
+            "compression": compression,
+            "threshold": threshold,
+        },
+    )
+
+
+class TwoTierBackend(RedisBackend):
+    """
+    fastapi-cache2 backend with a size-bounded in-process L1 in front of
+    Redis. Purged keys are published on CACHE_INVALIDATION_CHANNEL so
+    every worker drops its L1 copy; the short L1 TTL bounds staleness
+    if a message is missed.
+
+    Misses are single-flight: one request per key refills the entry while
+    concurrent requests in the process await it, and other processes
+    either get the stale entry, kept in Redis for `stale_ttl` seconds
+    past its expiry, or wait up to `lock_timeout` for the refill. A
+    refill that fails is released, and its waiters recompute at once.
+    A refill is not stored if one of its tags was invalidated after the
+    miss, since it may have read the database before the write.
+    **Parameters**
+    * `redis`: Client used for entries, tags and invalidation messages
+    * `l1_size`: Maximum number of entries kept in process
+    * `l1_ttl`: Maximum lifetime of an L1 entry in seconds
+    * `stale_ttl`: Seconds an expired entry may still be served
+    * `lock_timeout`: Seconds one request may spend refilling an entry
+    * `settle_ttl`: Longest expiry of an entry refilled within this many
+      seconds of an invalidation of its tags, to bound how long a read
+      from a lagging replica is served
+    * `breaker`: Circuit breaker every Redis call goes through; while it
+      is open, requests skip the cache and tag invalidations are queued
+      until `replay_invalidations`
+    """
+
+    poll_interval = 0.05
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        l1_size: int,
+        l1_ttl: int,
+        stale_ttl: int = 0,
+        lock_timeout: float = 5,
+        breaker: Optional[CircuitBreaker] = None,
+        settle_ttl: int = 0,
+    ) -> None:
+        super().__init__(redis)
+        self.l1_ttl = l1_ttl
+        self.l1: TTLCache[str, Tuple[float, bytes]] = TTLCache(l1_size, l1_ttl)
+        self.stale_ttl = stale_ttl
+        self.lock_timeout = lock_timeout
+        self.settle_ttl = settle_ttl
+        self.refills: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self.breaker = breaker
+        self.pending_tags: Set[str] = set()
+
+    async def _redis(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if self.breaker is None:
+            return await func(*args, **kwargs)
+        return await self.breaker.call(func, *args, **kwargs)
+
+    def _remember(self, key: str, value: bytes, ttl: Optional[int]) -> None:
+        """Keep `value` in L1 along with when it expires in Redis."""
+        if ttl is None or ttl < 0:
+            ttl = self.l1_ttl
+        if ttl > 0:
+            self.l1.set(
+                key, (time.monotonic() + ttl, value), ttl=min(ttl, self.l1_ttl)
+            )
+
+    async def _get_fresh(self, key: str) -> Tuple[int, Optional[bytes], bool]:
+        """
+        Redis lookup returning the entry's TTL until expiry, the entry,
+        and whether it is past its expiry and only kept to be served
+        stale. A TTL of -1 means the entry never expires.
+        """
+        ttl, cached = await self._redis(super().get_with_ttl, key)
+        if cached is None or ttl < 0:
+            return ttl, cached, False
+        ttl -= self.stale_ttl
+        return max(ttl, 0), cached, ttl <= 0
+
+    async def _await_refill(self, key: str) -> Tuple[int, Optional[bytes]]:
+        """Wait for a refill started by this process, if one is running."""
+        deadline, refill = self.refills.get(key, (0, None))
+        timeout = deadline - time.monotonic()
+        if refill is None or timeout <= 0:
+            self.refills.pop(key, None)
+            return 0, None
+        try:
+            return await asyncio.wait_for(asyncio.shield(refill), timeout)
+        except TimeoutError:
+            return 0, None
+
+    async def _await_remote_refill(
+        self, key: str
+    ) -> Tuple[int, Optional[bytes]]:
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            locked = await self._redis(
+                self.redis.exists, LOCK_KEY.format(key=key)
+            )
+            ttl, cached, _ = await self._get_fresh(key)
+            if cached is not None:
+                return ttl, cached
+            if not locked:
+                break
+        return 0, None
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        endpoint = key_endpoint(key)
+        if (entry := self.l1.get(key)) is not None:
+            CACHE_TIER_REQUESTS.labels(tier="l1", result="hit").inc()
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+            expires_at, value = entry
+            return max(int(expires_at - time.monotonic()), 0), value
+        CACHE_TIER_REQUESTS.labels(tier="l1", result="miss").inc()
+
+        if key in self.refills:
+            ttl, cached = await self._await_refill(key)
+            if cached is not None:
+                CACHE_COALESCED.labels(mode="local").inc()
+                CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+                return ttl, cached
+
+        try:
+            return await self._get_remote(key, endpoint)
+        except (CircuitOpenError, *REDIS_FAILURES):
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="bypass").inc()
+            return 0, None
+
+    async def _get_remote(
+        self, key: str, endpoint: str
+    ) -> Tuple[int, Optional[bytes]]:
+        ttl, cached, stale = await self._get_fresh(key)
+        if cached is not None and not stale:
+            CACHE_TIER_REQUESTS.labels(tier="redis", result="hit").inc()
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+            self._remember(key, cached, ttl)
+            return ttl, cached
+        CACHE_TIER_REQUESTS.labels(tier="redis", result="miss").inc()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(
+                LOCK_KEY.format(key=key),
+                1,
+                nx=True,
+                px=int(self.lock_timeout * 1000),
+            )
+            for tag in entry_tags.get():
+                pipe.get(generation_key(tag))
+            locked, *generations = await self._redis(pipe.execute)
+        refill_generations.set(
+            tuple(
+                generation.decode() if generation else ""
+                for generation in generations
+            )
+        )
+        if locked:
+            self.refills[key] = (
+                time.monotonic() + self.lock_timeout,
+                asyncio.get_running_loop().create_future(),
+            )
+            refill_lease.set(key)
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="miss").inc()
+            return 0, None
+
+        if cached is None:
+            ttl, cached = await self._await_remote_refill(key)
+            mode = "remote"
+        else:
+            ttl, mode = 0, "stale"
+        if cached is None:
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="miss").inc()
+        else:
+            CACHE_COALESCED.labels(mode=mode).inc()
+            CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+        return ttl, cached
+
+    async def set(
+        self, key: str, value: bytes, expire: Optional[int] = None
+    ) -> None:
+        tags = entry_tags.get()
+        generations = refill_generations.get() or ()
+        entry_tags.set(())
+        refill_lease.set(None)
+        refill_generations.set(None)
+        result = (expire or -1, value)
+        try:
+            stored = await self._redis(
+                self.redis.eval,
+                STORE_ENTRY_SCRIPT,
+                2 + 2 * len(tags),
+                key,
+                LOCK_KEY.format(key=key),
+                *(tag_key(tag) for tag in tags),
+                *(generation_key(tag) for tag in tags),
+                value,
+                expire or 0,
+                self.stale_ttl,
+                self.settle_ttl,
+                *generations,
+            )
+        except (CircuitOpenError, *REDIS_FAILURES):
+            # Only the waiters in this process get the value until Redis
+            # is reachable again
+            pass
+        else:
+            if stored < 0:
+                # Waiters recompute rather than share the outdated value
+                result = (0, None)
+            else:
+                self._remember(key, value, stored or None)
+        _, refill = self.refills.pop(key, (0, None))
+        if refill is not None and not refill.done():
+            refill.set_result(result)
+
+    async def release(self, key: str) -> None:
+        """Give up the refill of `key` taken by `get_with_ttl`."""
+        _, refill = self.refills.pop(key, (0, None))
+        if refill is not None and not refill.done():
+            refill.set_result((0, None))
+        with suppress(CircuitOpenError, *REDIS_FAILURES):
+            await self._redis(self.redis.delete, LOCK_KEY.format(key=key))
+
+    async def clear(
+        self, namespace: Optional[str] = None, key: Optional[str] = None
+    ) -> int:
+        deleted = await self._redis(
+            super().clear, namespace=namespace, key=key
+        )
+        await self.broadcast([key] if key else [ALL_KEYS])
+        return deleted
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """
+        When Redis cannot be reached, L1 is dropped and `tags` are kept
+        for `replay_invalidations`, so entries written before the outage
+        are not served once it is over.
+        """
+        tags = set(tags)
+        try:
+            deleted = await self._redis(
+                self.redis.eval,
+                INVALIDATE_TAGS_SCRIPT,
+                2 * len(tags),
+                *(tag_key(tag) for tag in tags),
+                *(generation_key(tag) for tag in tags),
+                self.generation_ttl,
+            )
+        except (CircuitOpenError, *REDIS_FAILURES):
+            self.pending_tags.update(tags)
+            self.l1.clear()
+            raise
+        await self.broadcast([key.decode() for key in deleted])
+
+    @property
+    def generation_ttl(self) -> int:
+        """
+        Milliseconds a tag generation is kept: as long as a refill may
+        run or be capped. A refill outliving it is not stored.
+        """
+        return int(max(self.lock_timeout, self.settle_ttl) * 1000) + 1000
+
+    async def replay_invalidations(self) -> None:
+        tags, self.pending_tags = self.pending_tags, set()
+        if tags:
+            await self.invalidate_tags(tags)
+
+    async def broadcast(self, keys: List[str]) -> None:
+        for key in keys:
+            self.forget(key)
+        if keys:
+            await self._redis(
+                self.redis.publish, CACHE_INVALIDATION_CHANNEL, "\n".join(keys)
+            )
+
+    def forget(self, message: str) -> None:
+        for key in message.split("\n"):
+            if key == ALL_KEYS:
+                self.l1.clear()
+            else:
+                self.l1.pop(key)
+
+    async def listen(self) -> None:
+        await subscribe(self.redis, CACHE_INVALIDATION_CHANNEL, self.forget)
+
+
+async def invalidate_tags(*tags: str) -> None:
+    """
+    Delete every cached response tagged with any of `tags`.
+    Like fastapi-cache2 itself, a Redis failure is logged, not raised.
+    """
+    if not tags:
+        return
+    try:
+        await FastAPICache.get_backend().invalidate_tags(tags)
+    except (CircuitOpenError, *REDIS_FAILURES) as ex:
+        logger.exception(ex)
+
+
+async def replay_cache_invalidations() -> None:
+    await FastAPICache.get_backend().replay_invalidations()
+
+
+async def listen_cache_invalidations() -> None:
+    await FastAPICache.get_backend().listen()
+
+
+async def start_cache(redis: aioredis.Redis) -> None:
+    # Writers read their own writes from the primary for this long, so
+    # the replica may lag behind an invalidation as much
+    settle_ttl = (
+        db_settings.POSTGRES_PRIMARY_STICKINESS
+        if db_settings.POSTGRES_REPLICA_HOST
+        else 0
+    )
+    FastAPICache.reset()
+    FastAPICache.init(
+        TwoTierBackend(
+            redis,
+            l1_size=cache_settings.RESPONSE_CACHE_L1_SIZE,
+            l1_ttl=cache_settings.RESPONSE_CACHE_L1_TTL,
+            stale_ttl=cache_settings.RESPONSE_CACHE_STALE_TTL,
+            lock_timeout=cache_settings.RESPONSE_CACHE_LOCK_TIMEOUT,
+            breaker=redis_breaker,
+            settle_ttl=settle_ttl,
+        ),
+        prefix="fastapi-cache",
+        coder=compact_coder(),
+        key_builder=request_key_builder,
     )
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from .base import BaseSetting
 
@@ -33,11 +34,54 @@ class DBSettings(BaseSetting):
     POSTGRES_DB: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
+    POSTGRES_REPLICA_HOST: Optional[str] = None
+    POSTGRES_REPLICA_PORT: Optional[int] = None
+    POSTGRES_PRIMARY_STICKINESS: int = 5
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    POSTGRES_POOL_SIZE: int = 70
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: int = 30
+    POSTGRES_CONNECTION_BUDGET: Optional[int] = None
+    POSTGRES_POOL_PROCESSES: int = 1
 
 
 class RedisSetting(BaseSetting):
     REDIS_HOST: str
     REDIS_PORT: int
+    REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5
+    REDIS_SOCKET_TIMEOUT: float = 5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_BREAKER_TIMEOUT: float = 0.25
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_BREAKER_PROBE_INTERVAL: float = 1
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+
+
+class CacheSettings(BaseSetting):
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRINCIPAL_CACHE_REDIS_TTL: int = 300
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL: int = 300
+    JOB_LIST_CACHE_TTL: int = 3600
+    RESPONSE_CACHE_L1_SIZE: int = 1000
+    RESPONSE_CACHE_L1_TTL: int = 10
+    RESPONSE_CACHE_STALE_TTL: int = 30
+    RESPONSE_CACHE_LOCK_TIMEOUT: float = 5
+    RESPONSE_CACHE_COMPRESSION: str = "zlib"
+    RESPONSE_CACHE_COMPRESSION_THRESHOLD: int = 1024
+
+
+class PasswordSettings(BaseSetting):
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64
+    PASSWORD_HASH_ROUNDS: int = 12
 
 
 class JWTSettings(BaseSetting):
@@ -45,6 +89,10 @@ class JWTSettings(BaseSetting):
     JWT_ALGORITHM: str
     JWT_ACCESS_TOKEN_EXPIRES: int
     JWT_REFRESH_TOKEN_EXPIRES: int
+    JWT_REFRESH_TOKEN_SINGLE_USE: bool = False
+    JWT_REVOCATION_CAPACITY: int = 100000
+    JWT_REVOCATION_ERROR_RATE: float = 0.001
+    JWT_REVOCATION_REFRESH_INTERVAL: int = 60
 
 
 class MailSettings(BaseSetting):
@@ -75,7 +123,9 @@ class AdminSettings(BaseSetting):
 app_settings = AppSettings()
 db_settings = DBSettings()
 jwt_settings = JWTSettings()
+password_settings = PasswordSettings()
 log_settings = LogSettings()
 redis_settings = RedisSetting()
+cache_settings = CacheSettings()
 mail_settings = MailSettings()
 admin_settings = AdminSettings()
@@ -0,0 +1,20 @@
+from enum import StrEnum
+
+MAX_BULK_JOBS = 1000
+EXPORT_BATCH_SIZE = 1000
+
+JOBS_ALL_TAG = "jobs:all"
+JOBS_AUTHOR_TAG = "jobs:author:{user_id}"
+JOBS_PERFORMER_TAG = "jobs:performer:{user_id}"
+
+
+class BulkItemStatus(StrEnum):
+    updated = "updated"
+    deleted = "deleted"
+    not_found = "not_found"
+    forbidden = "forbidden"
+
+
+class ExportFormat(StrEnum):
+    ndjson = "ndjson"
+    csv = "csv"
@@ -1,5 +1,8 @@
 from typing import Generic, Type
 
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from constants.crud_types import ModelType
 
 
@@ -12,3 +15,14 @@ class BaseCRUD(Generic[ModelType]):
 
     def __init__(self, model: Type[ModelType]) -> None:
         self.model = model
+
+
+async def refresh_unloaded(db: AsyncSession, obj: ModelType) -> None:
+    """
+    Refresh only the columns that RETURNING did not populate,
+    so a fully returned row costs no extra SELECT.
+    """
+    state = inspect(obj)
+    unloaded = state.unloaded & set(state.mapper.column_attrs.keys())
+    if unloaded:
+        await db.refresh(obj, attribute_names=unloaded)
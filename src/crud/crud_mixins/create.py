@@ -1,9 +1,10 @@
-from typing import Generic
+from typing import Generic, List, Sequence
 
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.crud_types import CreateSchemaType, ModelType
+from crud.crud_mixins.base import refresh_unloaded
 
 
 class CreateAsync(Generic[CreateSchemaType, ModelType]):
@@ -20,5 +21,32 @@ class CreateAsync(Generic[CreateSchemaType, ModelType]):
         obj = res.scalars().first()
         if commit:
             await db.commit()
-            await db.refresh(obj)
+            await refresh_unloaded(db, obj)
         return obj
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        create_schemas: Sequence[CreateSchemaType],
+        chunk_size: int = 1000,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        Insert objects with one multi-row INSERT ... RETURNING per chunk.
+        Returned objects keep the order of `create_schemas`.
+        """
+        objs = []
+        for start in range(0, len(create_schemas), chunk_size):
+            data = [
+                create_schema.model_dump(exclude_unset=True)
+                for create_schema in create_schemas[start : start + chunk_size]
+            ]
+            stmt = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            res = await db.scalars(stmt, data)
+            objs.extend(res.all())
+        if commit:
+            await db.commit()
+        return objs
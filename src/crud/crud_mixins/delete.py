@@ -1,19 +1,77 @@
-from typing import Generic, Optional
+from typing import Any, Generic, List, Optional, Sequence
+from uuid import UUID
 
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.crud_types import ModelType
+from utilities.exceptions import ObjectNotFoundError, PermissionDeniedError
 
 
 class DeleteAsync(Generic[ModelType]):
     async def remove(
         self, db: AsyncSession, *, obj_id: int, commit: bool = True
-    ) -> Optional[ModelType]:
-        obj = await db.get(self.model, obj_id)
-        if not obj:
-            return None
+    ) -> Optional[int]:
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == obj_id)
+            .returning(self.model.id)
+        )
+        res = await db.execute(stmt)
+        deleted_id = res.scalars().first()
+        if commit:
+            await db.commit()
+        return deleted_id
+
+    async def remove_by_uid(
+        self,
+        db: AsyncSession,
+        *,
+        uid: UUID,
+        owner_field: Optional[str] = None,
+        owner_id: Any = None,
+        commit: bool = True,
+    ) -> ModelType:
+        """
+        Delete by uid with one DELETE ... RETURNING, checking ownership in
+        the WHERE clause like `update_by_uid`. Returns the deleted object.
+        """
+        stmt = delete(self.model).where(self.model.uid == uid)
+        if owner_field is not None:
+            stmt = stmt.where(getattr(self.model, owner_field) == owner_id)
+        res = await db.execute(stmt.returning(self.model))
+        deleted_obj = res.scalars().first()
+        if deleted_obj is None:
+            exists_stmt = select(self.model.id).where(self.model.uid == uid)
+            if (await db.execute(exists_stmt)).first() is None:
+                msg = f"{self.model.__name__} {uid} not found."
+                raise ObjectNotFoundError(msg)
+            msg = f"{self.model.__name__} {uid} belongs to another user."
+            raise PermissionDeniedError(msg)
+        if commit:
+            await db.commit()
+        return deleted_obj
 
-        await db.delete(obj)
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        obj_ids: Sequence[Any],
+        key_field: str = "id",
+        owner_field: Optional[str] = None,
+        owner_id: Any = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        Delete rows whose `key_field` is in `obj_ids` with one
+        DELETE ... RETURNING and return the deleted objects.
+        """
+        key_column = getattr(self.model, key_field)
+        stmt = delete(self.model).where(key_column.in_(obj_ids))
+        if owner_field is not None:
+            stmt = stmt.where(getattr(self.model, owner_field) == owner_id)
+        res = await db.execute(stmt.returning(self.model))
+        deleted_objs = list(res.scalars().all())
         if commit:
             await db.commit()
-        return obj
+        return deleted_objs
@@ -1,14 +1,18 @@
-from typing import Generic, Optional, Sequence, Any
+from functools import cached_property
+from typing import Generic, Iterable, Optional, Sequence, Any, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import Row, RowMapping
+from sqlalchemy import Row, RowMapping, Select, bindparam, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from constants.crud_types import ModelType
+from utilities.pagination import decode_cursor, encode_cursor
 
 
 class ReadAsync(Generic[ModelType]):
+    cursor_field: str = "id"
+
     async def get(self, db: AsyncSession, obj_id: int) -> Optional[ModelType]:
         return await db.get(self.model, obj_id)
 
@@ -23,9 +27,61 @@ class ReadAsync(Generic[ModelType]):
 
         return result.scalars().all()
 
+    async def get_page(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[Sequence[Row[Any] | RowMapping | Any], Optional[str]]:
+        """
+        Keyset pagination ordered by (`cursor_field`, id).
+        Returns the page and an opaque cursor for the next one,
+        or None when the last page has been reached.
+        """
+        limit = max(limit, 1)
+        sort_column = getattr(self.model, self.cursor_field)
+        statement = (
+            select(self.model)
+            .order_by(sort_column, self.model.id)
+            .limit(limit + 1)
+        )
+        if cursor:
+            sort_value, obj_id = decode_cursor(
+                cursor, sort_column.type.python_type
+            )
+            statement = statement.where(
+                tuple_(sort_column, self.model.id) > (sort_value, obj_id)
+            )
+        result = await db.execute(statement)
+        objs = result.scalars().all()
+        if len(objs) <= limit:
+            return objs, None
+
+        objs = objs[:limit]
+        last_obj = objs[-1]
+        next_cursor = encode_cursor(
+            getattr(last_obj, self.cursor_field), last_obj.id
+        )
+        return objs, next_cursor
+
+    async def get_existing_ids(
+        self,
+        db: AsyncSession,
+        *,
+        obj_ids: Iterable[Any],
+        key_field: str = "id",
+    ) -> Set[Any]:
+        key_column = getattr(self.model, key_field)
+        statement = select(key_column).where(key_column.in_(list(obj_ids)))
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    @cached_property
+    def get_by_uid_statement(self) -> Select:
+        return select(self.model).where(self.model.uid == bindparam("uid"))
+
     async def get_by_uid(
         self, db: AsyncSession, *, uid: UUID
     ) -> Optional[ModelType]:
-        statement = select(self.model).where(self.model.uid == uid)
-        result = await db.execute(statement)
+        result = await db.execute(self.get_by_uid_statement, {"uid": uid})
         return result.scalars().first()
@@ -1,10 +1,13 @@
-from typing import Generic, Union
+from typing import Any, Generic, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import update
+from sqlalchemy import column, func, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.crud_types import ModelType, UpdateSchemaType
+from crud.crud_mixins.base import refresh_unloaded
+from utilities.exceptions import ObjectNotFoundError, PermissionDeniedError
 
 
 class UpdateAsync(Generic[ModelType, UpdateSchemaType]):
@@ -30,5 +33,148 @@ class UpdateAsync(Generic[ModelType, UpdateSchemaType]):
         obj = res.scalars().first()
         if commit:
             await db.commit()
-            await db.refresh(obj)
+            await refresh_unloaded(db, obj)
         return obj
+
+    async def update_by_uid(
+        self,
+        db: AsyncSession,
+        *,
+        uid: UUID,
+        update_data: Union[UpdateSchemaType, dict],
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        commit: bool = True,
+    ) -> ModelType:
+        """
+        Update by uid with one UPDATE ... RETURNING. When `owner_field` is
+        given, the row must also have `owner_field == owner_id`; this check
+        is part of the WHERE clause. A second query is made only when
+        nothing was updated, to tell ObjectNotFoundError from
+        PermissionDeniedError.
+        """
+        if isinstance(update_data, BaseModel):
+            update_data = update_data.model_dump(
+                exclude_unset=True, exclude_none=True
+            )
+        stmt = update(self.model).where(self.model.uid == uid)
+        if owner_field is not None:
+            stmt = stmt.where(getattr(self.model, owner_field) == owner_id)
+        stmt = stmt.values(**update_data).returning(self.model)
+        res = await db.execute(stmt)
+        obj = res.scalars().first()
+        if obj is None:
+            await self._raise_not_updated(db, uid)
+        if commit:
+            await db.commit()
+            await refresh_unloaded(db, obj)
+        return obj
+
+    async def update_by_uid_with_previous(
+        self,
+        db: AsyncSession,
+        *,
+        uid: UUID,
+        update_data: Union[UpdateSchemaType, dict],
+        previous_field: str,
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        commit: bool = True,
+    ) -> Tuple[ModelType, Any]:
+        """
+        `update_by_uid` that also returns the value `previous_field` had
+        before the update, read by the same UPDATE ... FROM (SELECT ...
+        FOR UPDATE) statement, so no concurrent update can land between
+        the read and the write.
+        """
+        if isinstance(update_data, BaseModel):
+            update_data = update_data.model_dump(
+                exclude_unset=True, exclude_none=True
+            )
+        old = (
+            select(self.model.id, getattr(self.model, previous_field))
+            .where(self.model.uid == uid)
+            .with_for_update()
+            .subquery("old")
+        )
+        stmt = update(self.model).where(self.model.id == old.c.id)
+        if owner_field is not None:
+            stmt = stmt.where(getattr(self.model, owner_field) == owner_id)
+        stmt = stmt.values(**update_data).returning(
+            self.model, old.c[previous_field].label("previous")
+        )
+        res = await db.execute(stmt)
+        row = res.first()
+        if row is None:
+            await self._raise_not_updated(db, uid)
+        obj, previous = row
+        if commit:
+            await db.commit()
+            await refresh_unloaded(db, obj)
+        return obj, previous
+
+    async def _raise_not_updated(self, db: AsyncSession, uid: UUID) -> None:
+        """ObjectNotFoundError, or PermissionDeniedError when the row
+        exists but the owner check left it out of the update."""
+        exists_stmt = select(self.model.id).where(self.model.uid == uid)
+        if (await db.execute(exists_stmt)).first() is None:
+            msg = f"{self.model.__name__} {uid} not found."
+            raise ObjectNotFoundError(msg)
+        msg = f"{self.model.__name__} {uid} belongs to another user."
+        raise PermissionDeniedError(msg)
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        update_data: Sequence[Union[UpdateSchemaType, dict]],
+        key_field: str = "id",
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        Apply per-row values with one UPDATE ... FROM (VALUES ...).
+        Every item carries its `key_field`; like `update`, unset and
+        None fields keep their current value.
+        Rows whose key was not found are absent from the result.
+        """
+        rows = [
+            item.model_dump(exclude_unset=True, exclude_none=True)
+            if isinstance(item, BaseModel)
+            else item
+            for item in update_data
+        ]
+        if not rows:
+            return []
+
+        table = self.model.__table__
+        key_column = getattr(self.model, key_field)
+        fields = sorted({field for row in rows for field in row} - {key_field})
+        if not fields:
+            statement = select(self.model).where(
+                key_column.in_([row[key_field] for row in rows])
+            )
+            res = await db.execute(statement)
+            return list(res.scalars().all())
+
+        names = [key_field, *fields]
+        source = values(
+            *(column(name, table.c[name].type) for name in names),
+            name="update_values",
+        ).data([tuple(row.get(name) for name in names) for row in rows])
+        stmt = (
+            update(self.model)
+            .where(key_column == source.c[key_field])
+            .values(
+                {
+                    name: func.coalesce(source.c[name], table.c[name])
+                    for name in fields
+                }
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        res = await db.execute(stmt)
+        objs = list(res.scalars().all())
+        if commit:
+            await db.commit()
+        return objs
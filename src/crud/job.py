@@ -1,23 +1,40 @@
 from datetime import datetime
-from typing import Any, Sequence, List
+from functools import cached_property
+from typing import Any, Dict, Iterable, Optional, Sequence, List, Tuple
+from uuid import UUID
 
-from sqlalchemy import Row, RowMapping, select
+from sqlalchemy import Row, RowMapping, Select, bindparam, func, or_, select
 from sqlalchemy.orm import joinedload
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
 from crud.async_crud import BaseAsyncCRUD
-from models import Job
+from models import Job, User
 from schemas.job import JobCreateDB, JobUpdateDB
 
 
 class CRUDJob(BaseAsyncCRUD[Job, JobCreateDB, JobUpdateDB]):
+    cursor_field = "created_at"
+
+    @cached_property
+    def get_by_author_id_statement(self) -> Select:
+        return select(self.model).where(
+            self.model.author_id == bindparam("author_id")
+        )
+
+    @cached_property
+    def get_by_performer_id_statement(self) -> Select:
+        return select(self.model).where(
+            self.model.performer_id == bindparam("performer_id")
+        )
+
     async def get_by_author_id(
         self,
         db: AsyncSession,
         author_id: int,
     ) -> Sequence[Row[Any] | RowMapping | Any]:
-        statement = select(self.model).where(self.model.author_id == author_id)
-        result = await db.execute(statement)
+        result = await db.execute(
+            self.get_by_author_id_statement, {"author_id": author_id}
+        )
 
         return result.scalars().all()
 
@@ -26,13 +43,121 @@ class CRUDJob(BaseAsyncCRUD[Job, JobCreateDB, JobUpdateDB]):
         db: AsyncSession,
         performer_id: int,
     ) -> Sequence[Row[Any] | RowMapping | Any]:
-        statement = select(self.model).where(
-            self.model.performer_id == performer_id
+        result = await db.execute(
+            self.get_by_performer_id_statement,
+            {"performer_id": performer_id},
         )
-        result = await db.execute(statement)
 
         return result.scalars().all()
 
+    def list_version_statement(self, column: Any) -> Select:
+        """
+        Row count, newest `updated_at` and the sum of every `updated_at`
+        of the jobs where `column` equals the `user_id` parameter. Any
+        insert, update or delete changes at least one of them, and all
+        three come from an index-only scan of (`column`, updated_at).
+        """
+        return select(
+            func.count(),
+            func.max(self.model.updated_at),
+            func.sum(func.extract("epoch", self.model.updated_at)),
+        ).where(column == bindparam("user_id"))
+
+    @cached_property
+    def get_author_version_statement(self) -> Select:
+        return self.list_version_statement(self.model.author_id)
+
+    @cached_property
+    def get_performer_version_statement(self) -> Select:
+        return self.list_version_statement(self.model.performer_id)
+
+    @cached_property
+    def get_updated_at_statement(self) -> Select:
+        return select(self.model.updated_at).where(
+            self.model.uid == bindparam("uid")
+        )
+
+    async def get_author_version(
+        self, db: AsyncSession, *, author_id: int
+    ) -> Tuple[Any, ...]:
+        result = await db.execute(
+            self.get_author_version_statement, {"user_id": author_id}
+        )
+        return tuple(result.one())
+
+    async def get_performer_version(
+        self, db: AsyncSession, *, performer_id: int
+    ) -> Tuple[Any, ...]:
+        result = await db.execute(
+            self.get_performer_version_statement, {"user_id": performer_id}
+        )
+        return tuple(result.one())
+
+    async def get_updated_at(
+        self, db: AsyncSession, *, uid: UUID
+    ) -> Optional[datetime]:
+        result = await db.execute(self.get_updated_at_statement, {"uid": uid})
+        return result.scalar_one_or_none()
+
+    async def get_performer_ids(
+        self, db: AsyncSession, *, uids: Iterable[UUID]
+    ) -> Dict[UUID, int]:
+        statement = select(self.model.uid, self.model.performer_id).where(
+            self.model.uid.in_(list(uids))
+        )
+        result = await db.execute(statement)
+        return dict(result.tuples().all())
+
+    async def get_participants(
+        self, db: AsyncSession, *, user_uid: UUID
+    ) -> Sequence[Row[Tuple[int, int]]]:
+        """Author and performer ids of every job the user takes part in."""
+        user_id = select(User.id).where(User.uid == user_uid).scalar_subquery()
+        statement = select(
+            self.model.author_id, self.model.performer_id
+        ).where(
+            or_(
+                self.model.author_id == user_id,
+                self.model.performer_id == user_id,
+            )
+        )
+        result = await db.execute(statement)
+        return result.all()
+
+    async def stream_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        author_id: Optional[int] = None,
+        performer_id: Optional[int] = None,
+        is_archived: Optional[bool] = None,
+        is_completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> AsyncScalarResult[Job]:
+        """
+        Jobs matching the given filters through a server-side cursor,
+        fetched `batch_size` rows at a time.
+        """
+        filters = {
+            "author_id": author_id,
+            "performer_id": performer_id,
+            "is_archived": is_archived,
+            "is_completed": is_completed,
+        }
+        statement = (
+            select(self.model)
+            .filter_by(
+                **{
+                    key: value
+                    for key, value in filters.items()
+                    if value is not None
+                }
+            )
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return await db.stream_scalars(statement)
+
     async def get_by_updated(
         self,
         db: AsyncSession,
@@ -1,6 +1,7 @@
+from functools import cached_property
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crud.async_crud import BaseAsyncCRUD
@@ -9,25 +10,44 @@ from schemas.user import UserCreateDB, UserUpdateDB
 
 
 class CRUDUser(BaseAsyncCRUD[User, UserCreateDB, UserUpdateDB]):
+    cursor_field = "registered_at"
+
+    @cached_property
+    def check_for_user_statement(self) -> Select:
+        return select(self.model.id).where(
+            func.lower(self.model.username) == func.lower(bindparam("slug"))
+        )
+
+    @cached_property
+    def get_by_email_statement(self) -> Select:
+        return select(self.model).where(self.model.email == bindparam("email"))
+
+    @cached_property
+    def get_by_username_statement(self) -> Select:
+        return select(self.model).where(
+            self.model.username == bindparam("username")
+        )
+
     async def check_for_user(self, db: AsyncSession, slug: str) -> bool:
-        stmt = select(self.model).where(
-            func.lower(self.model.username) == func.lower(slug)
+        result = await db.execute(
+            self.check_for_user_statement, {"slug": slug}
         )
-        result = await db.execute(stmt)
-        return bool(result.fetchone())
+        return bool(result.first())
 
     async def get_by_email(
         self, db: AsyncSession, *, email: str
     ) -> Optional[User]:
-        statement = select(self.model).where(self.model.email == email)
-        result = await db.execute(statement)
+        result = await db.execute(
+            self.get_by_email_statement, {"email": email}
+        )
         return result.scalars().first()
 
     async def get_by_username(
         self, db: AsyncSession, *, username: str
     ) -> Optional[User]:
-        statement = select(self.model).where(self.model.username == username)
-        result = await db.execute(statement)
+        result = await db.execute(
+            self.get_by_username_statement, {"username": username}
+        )
         return result.scalars().first()
 
     async def get_admin(self, db: AsyncSession) -> bool:
@@ -1,31 +1,70 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from configs.config import db_settings
+from databases.pool import (
+    InstrumentedAsyncPool,
+    pool_budget,
+    register_pool_metrics,
+)
+
+
+def build_database_url(host: str, port: int) -> str:
+    return (
+        "postgresql+asyncpg://"
+        f"{db_settings.POSTGRES_USER}:"
+        f"{db_settings.POSTGRES_PASSWORD}@"
+        f"{host}:"
+        f"{port}/"
+        f"{db_settings.POSTGRES_DB}"
+        "?prepared_statement_cache_size="
+        f"{db_settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE}"
+    )
+
 
-SQLALCHEMY_DATABASE_URL = (
-    "postgresql+asyncpg://"
-    f"{db_settings.POSTGRES_USER}:"
-    f"{db_settings.POSTGRES_PASSWORD}@"
-    f"{db_settings.POSTGRES_HOST}:"
-    f"{db_settings.POSTGRES_PORT}/"
-    f"{db_settings.POSTGRES_DB}"
+SQLALCHEMY_DATABASE_URL = build_database_url(
+    db_settings.POSTGRES_HOST, db_settings.POSTGRES_PORT
 )
 
+POOL_SIZE, MAX_OVERFLOW = pool_budget(db_settings)
+
+ENGINE_OPTIONS = {
+    "poolclass": InstrumentedAsyncPool,
+    "pool_size": POOL_SIZE,
+    "max_overflow": MAX_OVERFLOW,
+    "echo": False,
+    "pool_pre_ping": True,
+    "pool_timeout": db_settings.POSTGRES_POOL_TIMEOUT,
+    "pool_recycle": 300,
+}
+
 async_engine = create_async_engine(
     url=SQLALCHEMY_DATABASE_URL,
-    pool_size=70,
-    max_overflow=10,
-    echo=False,
-    pool_pre_ping=True,
-    pool_timeout=30,
-    pool_recycle=300,
+    pool_logging_name="primary",
+    **ENGINE_OPTIONS,
 )
+register_pool_metrics(async_engine, "primary")
+
+if db_settings.POSTGRES_REPLICA_HOST:
+    SQLALCHEMY_REPLICA_DATABASE_URL = build_database_url(
+        db_settings.POSTGRES_REPLICA_HOST,
+        db_settings.POSTGRES_REPLICA_PORT or db_settings.POSTGRES_PORT,
+    )
+    replica_engine = create_async_engine(
+        url=SQLALCHEMY_REPLICA_DATABASE_URL,
+        pool_logging_name="replica",
+        **ENGINE_OPTIONS,
+    )
+    register_pool_metrics(replica_engine, "replica")
+else:
+    replica_engine = async_engine
 
 
 async_session = async_sessionmaker(
@@ -34,6 +73,18 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+replica_session = async_sessionmaker(
+    replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_writes(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
@@ -0,0 +1,35 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 5b1e7c3a9d42
+Revises: f638fce04851
+Create Date: 2026-10-18 10:12:41.527118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e7c3a9d42"
+down_revision: Union[str, None] = "f638fce04851"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_job_created_at_id", "job", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_user_registered_at_id",
+        "user",
+        ["registered_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_registered_at_id", table_name="user")
+    op.drop_index("ix_job_created_at_id", table_name="job")
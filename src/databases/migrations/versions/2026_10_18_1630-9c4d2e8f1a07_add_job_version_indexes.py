@@ -0,0 +1,38 @@
+"""add_job_version_indexes
+
+Revision ID: 9c4d2e8f1a07
+Revises: 5b1e7c3a9d42
+Create Date: 2026-10-18 16:30:12.804311
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4d2e8f1a07"
+down_revision: Union[str, None] = "5b1e7c3a9d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_job_author_id_updated_at",
+        "job",
+        ["author_id", "updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_job_performer_id_updated_at",
+        "job",
+        ["performer_id", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_performer_id_updated_at", table_name="job")
+    op.drop_index("ix_job_author_id_updated_at", table_name="job")
@@ -0,0 +1,108 @@
+import time
+from typing import Tuple
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from configs.config import DBSettings
+from utilities.metrics import Counter, Gauge, Histogram
+
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+POOL_OVERFLOW_EVENTS = Counter(
+    "db_pool_overflow_total",
+    "Connections opened beyond pool_size",
+    ["pool"],
+)
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pooled connections by state",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait, overflow,
+    timeouts and connections by state under its `logging_name`."""
+
+    @property
+    def metrics_name(self) -> str:
+        return self.logging_name or "default"
+
+    def record_connections(self) -> None:
+        name = self.metrics_name
+        POOL_CONNECTIONS.labels(pool=name, state="in_use").set(
+            self.checkedout()
+        )
+        POOL_CONNECTIONS.labels(pool=name, state="idle").set(self.checkedin())
+        POOL_CONNECTIONS.labels(pool=name, state="overflow").set(
+            max(self.overflow(), 0)
+        )
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        name = self.metrics_name
+        overflow = self.overflow()
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(pool=name).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.labels(pool=name).observe(
+                time.perf_counter() - start
+            )
+        if self.overflow() > max(overflow, 0):
+            POOL_OVERFLOW_EVENTS.labels(pool=name).inc()
+        self.record_connections()
+        return connection
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self.record_connections()
+
+
+def pool_budget(settings: DBSettings) -> Tuple[int, int]:
+    """
+    pool_size and max_overflow for one process. With a connection budget,
+    the budget is split evenly between POSTGRES_POOL_PROCESSES processes,
+    so all of them together never exceed it. Raises ValueError when the
+    budget cannot give every process a connection.
+    """
+    if not settings.POSTGRES_CONNECTION_BUDGET:
+        return settings.POSTGRES_POOL_SIZE, settings.POSTGRES_MAX_OVERFLOW
+
+    processes = max(settings.POSTGRES_POOL_PROCESSES, 1)
+    per_process = settings.POSTGRES_CONNECTION_BUDGET // processes
+    if per_process < 1:
+        msg = (
+            f"POSTGRES_CONNECTION_BUDGET={settings.POSTGRES_CONNECTION_BUDGET}"
+            f" is less than one connection for each of the {processes}"
+            " POSTGRES_POOL_PROCESSES"
+        )
+        raise ValueError(msg)
+    max_overflow = min(settings.POSTGRES_MAX_OVERFLOW, per_process // 5)
+    return per_process - max_overflow, max_overflow
+
+
+def register_pool_metrics(engine: AsyncEngine, name: str) -> None:
+    pool = engine.pool
+    POOL_SIZE.labels(pool=name).set(pool.size())
+    if isinstance(pool, InstrumentedAsyncPool):
+        pool.record_connections()
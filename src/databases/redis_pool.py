@@ -0,0 +1,175 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
+
+from configs.config import RedisSetting, redis_settings
+from utilities.circuit_breaker import CircuitBreaker
+from utilities.metrics import Counter, Gauge, Histogram
+
+REDIS_FAILURES = (RedisError, OSError, TimeoutError)
+
+REDIS_COMMAND_SECONDS = Histogram(
+    "redis_command_seconds",
+    "Redis command latency, pipelines counted as one PIPELINE command",
+    ["command"],
+)
+REDIS_COMMAND_ERRORS = Counter(
+    "redis_command_errors_total",
+    "Redis commands that raised",
+    ["command"],
+)
+REDIS_POOL_CONNECTIONS = Gauge(
+    "redis_pool_connections",
+    "Pooled Redis connections by state",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_SIZE = Gauge(
+    "redis_pool_max_connections",
+    "Configured REDIS_MAX_CONNECTIONS",
+    multiprocess_mode="livesum",
+)
+
+
+def record_pool_connections(pool: aioredis.ConnectionPool) -> None:
+    REDIS_POOL_CONNECTIONS.labels(state="in_use").set(
+        len(pool._in_use_connections)  # noqa: SLF001
+    )
+    REDIS_POOL_CONNECTIONS.labels(state="idle").set(
+        len(pool._available_connections)  # noqa: SLF001
+    )
+
+
+@contextmanager
+def observe(command: str, pool: aioredis.ConnectionPool) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    except RedisError:
+        REDIS_COMMAND_ERRORS.labels(command=command).inc()
+        raise
+    finally:
+        REDIS_COMMAND_SECONDS.labels(command=command).observe(
+            time.perf_counter() - start
+        )
+        record_pool_connections(pool)
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        with observe("PIPELINE", self.connection_pool):
+            return await super().execute(raise_on_error)
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """Redis client recording the latency of every command it sends
+    and the pool's connections once it is done."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        command = args[0]
+        if isinstance(command, bytes):
+            command = command.decode()
+        with observe(command.upper(), self.connection_pool):
+            return await super().execute_command(*args, **options)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+
+
+class RedisConnectionManager:
+    """
+    The process's single Redis connection pool, shared by the app state,
+    the response cache and the pub/sub listeners. Every listener keeps
+    one connection for itself, so REDIS_MAX_CONNECTIONS must leave room
+    for them. Replies are bytes; callers decode what they need.
+    Celery runs in its own processes and gets the same settings through
+    `celery_options`.
+    **Parameters**
+    * `settings`: Redis address, pool size, timeouts and health checks
+    """
+
+    def __init__(self, settings: RedisSetting) -> None:
+        self.settings = settings
+        self.pool: Optional[aioredis.BlockingConnectionPool] = None
+        self.client: Optional[InstrumentedRedis] = None
+
+    def connect(self) -> InstrumentedRedis:
+        if self.client is None:
+            self.pool = aioredis.BlockingConnectionPool.from_url(
+                self.settings.url,
+                max_connections=self.settings.REDIS_MAX_CONNECTIONS,
+                timeout=self.settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=self.settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=(
+                    self.settings.REDIS_SOCKET_CONNECT_TIMEOUT
+                ),
+                health_check_interval=self.settings.REDIS_HEALTH_CHECK_INTERVAL,
+                decode_responses=False,
+            )
+            self.client = InstrumentedRedis.from_pool(self.pool)
+            REDIS_POOL_SIZE.set(self.settings.REDIS_MAX_CONNECTIONS)
+        return self.client
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+        self.client = None
+        self.pool = None
+        REDIS_POOL_CONNECTIONS.labels(state="in_use").set(0)
+        REDIS_POOL_CONNECTIONS.labels(state="idle").set(0)
+
+    def in_use_connections(self) -> int:
+        if self.pool is None:
+            return 0
+        return len(self.pool._in_use_connections)  # noqa: SLF001
+
+    def idle_connections(self) -> int:
+        if self.pool is None:
+            return 0
+        return len(self.pool._available_connections)  # noqa: SLF001
+
+    def celery_options(self) -> Dict[str, Any]:
+        transport_options = {
+            "max_connections": self.settings.REDIS_MAX_CONNECTIONS,
+            "socket_timeout": self.settings.REDIS_SOCKET_TIMEOUT,
+            "socket_connect_timeout": (
+                self.settings.REDIS_SOCKET_CONNECT_TIMEOUT
+            ),
+            "health_check_interval": self.settings.REDIS_HEALTH_CHECK_INTERVAL,
+        }
+        return {
+            "broker_url": self.settings.url,
+            "result_backend": self.settings.url,
+            "broker_transport_options": transport_options,
+            "result_backend_transport_options": transport_options,
+            "redis_max_connections": self.settings.REDIS_MAX_CONNECTIONS,
+            "redis_socket_timeout": self.settings.REDIS_SOCKET_TIMEOUT,
+            "redis_socket_connect_timeout": (
+                self.settings.REDIS_SOCKET_CONNECT_TIMEOUT
+            ),
+            "redis_backend_health_check_interval": (
+                self.settings.REDIS_HEALTH_CHECK_INTERVAL
+            ),
+        }
+
+
+redis_manager = RedisConnectionManager(redis_settings)
+# Shared by everything that can do without Redis for a while
+redis_breaker = CircuitBreaker(
+    "redis",
+    failure_threshold=redis_settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    timeout=redis_settings.REDIS_BREAKER_TIMEOUT,
+    probe_interval=redis_settings.REDIS_BREAKER_PROBE_INTERVAL,
+    failures=REDIS_FAILURES,
+)
@@ -1,7 +1,7 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncContextManager
 
-from redis import asyncio as aioredis
 import uvicorn
 
 from fastapi import FastAPI
@@ -10,26 +10,57 @@ from starlette.middleware.cors import CORSMiddleware
 
 from api.admin.admin import load_admin_site
 from api.admin.views.auth import AdminAuth
+from api.metrics import router as metrics_router
 from api.v1.router import router as v1_router
-from cache import start_cache
+from cache import (
+    listen_cache_invalidations,
+    replay_cache_invalidations,
+    start_cache,
+)
 from crud.user import crud_user
-from configs.config import app_settings, redis_settings
+from configs.config import app_settings
 from configs.loggers import logger
 from databases.database import async_engine, async_session
+from databases.redis_pool import (
+    REDIS_FAILURES,
+    redis_breaker,
+    redis_manager,
+)
+from security.principal_cache import principal_cache
+from security.revocation import token_revocations
 from services.user import create_admin
+from utilities.metrics import mark_process_dead
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncContextManager[None]:
     logger.info("Startup redis connection")
-    redis_from_url = await aioredis.from_url(
-        f"redis://{redis_settings.REDIS_HOST}:{redis_settings.REDIS_PORT}",
-        encoding="utf8",
-        decode_responses=True,
-    )
-    app.state.redis = redis_from_url
+    redis = redis_manager.connect()
+    app.state.redis = redis
 
-    await start_cache()
+    await start_cache(redis)
+    principal_cache.init(redis, redis_breaker)
+    token_revocations.init(redis, redis_breaker)
+    try:
+        await token_revocations.load()
+    except REDIS_FAILURES as ex:
+        msg = f"Starting with no revoked tokens, Redis unavailable: {ex}"
+        logger.warning(msg)
+    background_tasks = [
+        asyncio.create_task(listen_cache_invalidations()),
+        asyncio.create_task(principal_cache.listen()),
+        asyncio.create_task(token_revocations.listen()),
+        asyncio.create_task(token_revocations.refresh()),
+        asyncio.create_task(
+            redis_breaker.watch(
+                redis.ping,
+                retry=[
+                    replay_cache_invalidations,
+                    principal_cache.replay_invalidations,
+                ],
+            )
+        ),
+    ]
 
     async with async_session() as db:
         admin_exists = await crud_user.get_admin(db)
@@ -40,8 +71,13 @@ async def lifespan(app: FastAPI) -> AsyncContextManager[None]:
             logger.info("Admin already exists, skipping creation.")
 
     yield
+    for task in background_tasks:
+        task.cancel()
+    with suppress(asyncio.CancelledError):
+        await asyncio.gather(*background_tasks)
     logger.info("Shutdown redis connection")
-    await redis_from_url.close()
+    await redis_manager.close()
+    mark_process_dead()
 
 
 def create_app() -> FastAPI:
@@ -59,6 +95,7 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.include_router(v1_router, prefix="/api")
+    app.include_router(metrics_router, include_in_schema=False)
     return app
 
 
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, PositiveInt
 
+from constants.job import BulkItemStatus
+
 
 class JobBase(BaseModel):
     title: str
@@ -36,6 +38,10 @@ class JobUpdate(BaseModel):
     is_archived: Optional[bool] = None
 
 
+class JobBulkUpdate(JobUpdate):
+    uid: UUID
+
+
 class JobUpdateForPerformer(BaseModel):
     is_completed: Optional[bool] = None
 
@@ -51,3 +57,14 @@ class JobResponse(JobCreate):
     updated_at: datetime
     is_completed: Optional[bool] = None
     is_archived: Optional[bool] = None
+
+
+class JobPage(BaseModel):
+    items: List[JobResponse]
+    next_cursor: Optional[str] = None
+
+
+class JobBulkResult(BaseModel):
+    uid: UUID
+    status: BulkItemStatus
+    job: Optional[JobResponse] = None
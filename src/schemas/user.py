@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, EmailStr
@@ -55,6 +56,26 @@ class UserResponse(UserBase):
     username: Optional[str] = None
 
 
+class UserPage(BaseModel):
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+
+
 class UserForAdminResponse(UserResponse):
     is_admin: bool
     is_deleted: bool
+
+
+class UserPrincipal(BaseModel):
+    id: int
+    uid: UUID
+    first_name: str
+    second_name: str
+    username: str
+    email: str
+    is_admin: bool
+    is_deleted: bool
+    registered_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,58 @@
+"""
+Pick PASSWORD_HASH_ROUNDS for this machine: the highest bcrypt cost
+whose median hashing time stays within the target latency.
+
+Run from `src/`:
+    python -m security.calibrate --target-ms 250
+"""
+
+import argparse
+import statistics
+import time
+from typing import List, Tuple
+
+from passlib.context import CryptContext
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+
+
+def measure(rounds: int, samples: int) -> float:
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    results = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        results.append(time.perf_counter() - start)
+    return statistics.median(results)
+
+
+def calibrate(
+    target: float, samples: int = 5
+) -> Tuple[int, List[Tuple[int, float]]]:
+    """
+    Return the chosen cost and the measured (rounds, median seconds).
+    Each extra round doubles the cost, so measuring stops at the first
+    cost above the target.
+    """
+    measured = []
+    chosen = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed = measure(rounds, samples)
+        measured.append((rounds, elapsed))
+        if elapsed > target:
+            break
+        chosen = rounds
+    return chosen, measured
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    rounds, measured = calibrate(args.target_ms / 1000, args.samples)
+    for cost, elapsed in measured:
+        print(f"rounds {cost:2}  median {elapsed * 1000:9.2f} ms")  # noqa: T201
+    print(f"PASSWORD_HASH_ROUNDS={rounds}")  # noqa: T201
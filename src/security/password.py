@@ -1,11 +1,150 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from configs.config import password_settings
+from utilities.exceptions import PasswordHashQueueFullError
+from utilities.metrics import Counter, Gauge, Histogram
+
+ResultT = TypeVar("ResultT")
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=password_settings.PASSWORD_HASH_ROUNDS,
+)
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash operations waiting for a free worker",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_IN_PROGRESS = Gauge(
+    "password_hash_in_progress",
+    "Password hash operations running on a worker",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash operations rejected because the queue was full",
+)
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password hash operation waited for a worker",
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on a worker",
+    ["operation"],
+)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so that hashing never blocks
+    the event loop. bcrypt releases the GIL while hashing.
+    **Parameters**
+    * `workers`: Number of hashing threads
+    * `queue_limit`: Operations allowed to wait for a worker, further
+    calls raise PasswordHashQueueFullError
+    """
+
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_limit
+        self.pending = 0
+        self._lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.pending - self.workers, 0)
+
+    @property
+    def in_progress(self) -> int:
+        return min(self.pending, self.workers)
+
+    def _timed(
+        self,
+        operation: str,
+        submitted_at: float,
+        func: Callable[..., ResultT],
+        *args: Any,
+    ) -> ResultT:
+        started_at = time.perf_counter()
+        PASSWORD_HASH_WAIT.observe(started_at - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_DURATION.labels(operation=operation).observe(
+                time.perf_counter() - started_at
+            )
+
+    def _record_pending(self) -> None:
+        PASSWORD_HASH_QUEUE_DEPTH.set(self.queue_depth)
+        PASSWORD_HASH_IN_PROGRESS.set(self.in_progress)
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+            self._record_pending()
+
+    async def run(
+        self, operation: str, func: Callable[..., ResultT], *args: Any
+    ) -> ResultT:
+        with self._lock:
+            if self.pending >= self.capacity:
+                PASSWORD_HASH_REJECTED.inc()
+                msg = "Password hashing queue is full."
+                raise PasswordHashQueueFullError(msg)
+            self.pending += 1
+            self._record_pending()
+
+        try:
+            job = self.executor.submit(
+                self._timed, operation, time.perf_counter(), func, *args
+            )
+        except RuntimeError:
+            self._release(None)
+            raise
+        # A caller that stops waiting does not stop the job, so the slot
+        # is given back when the job is done, not when the caller is.
+        job.add_done_callback(self._release)
+        return await asyncio.wrap_future(job)
+
+
+password_hasher = PasswordHasher(
+    workers=password_settings.PASSWORD_HASH_WORKERS,
+    queue_limit=password_settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
 
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_hasher.run(
+        "verify", pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify the password and, when the stored hash uses another scheme or
+    cost than PASSWORD_HASH_ROUNDS, also return a replacement hash.
+    """
+    return await password_hasher.run(
+        "verify",
+        pwd_context.verify_and_update,
+        plain_password,
+        hashed_password,
+    )
 
 
 async def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return await password_hasher.run("hash", pwd_context.hash, password)
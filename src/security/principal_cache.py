@@ -0,0 +1,189 @@
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional, Set, Tuple
+from uuid import UUID
+
+from redis import asyncio as aioredis
+
+from configs.config import cache_settings
+from configs.loggers import logger
+from databases.redis_pool import REDIS_FAILURES
+from models import User
+from schemas.user import UserPrincipal
+from utilities.circuit_breaker import CircuitBreaker
+from utilities.exceptions import CircuitOpenError
+from utilities.lru import TTLCache
+from utilities.metrics import Counter
+from utilities.pubsub import subscribe
+
+PRINCIPAL_KEY = "principal:{user_uid}"
+PRINCIPAL_GENERATION_KEY = "principal:{user_uid}:generation"
+PRINCIPAL_INVALIDATION_CHANNEL = "principal-invalidation"
+
+# KEYS: principal, generation. ARGV: generation ttl
+# Deletes the principal and stamps the generation with the time of the
+# invalidation, so a lookup that missed before it cannot store its read
+INVALIDATE_PRINCIPAL_SCRIPT = """
+local time = redis.call('TIME')
+local now = time[1] * 1000000 + time[2]
+local previous = tonumber(redis.call('GET', KEYS[2])) or 0
+redis.call('DEL', KEYS[1])
+redis.call(
+    'SET', KEYS[2], string.format('%.0f', math.max(now, previous + 1)),
+    'EX', ARGV[1]
+)
+"""
+
+# KEYS: principal, generation. ARGV: value, expire, generation seen
+# Returns 0 without storing when the user was invalidated since the miss
+STORE_PRINCIPAL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[3] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+# User uid and its generation when its lookup missed, checked by `set`;
+# no generation when Redis could not be read
+principal_generation: ContextVar[Optional[Tuple[str, Optional[bytes]]]] = (
+    ContextVar("principal_generation", default=None)
+)
+
+PRINCIPAL_LOOKUPS = Counter(
+    "principal_cache_lookups_total",
+    "Authenticated user lookups by the tier that answered",
+    ["tier"],
+)
+
+
+class PrincipalCache:
+    """
+    Authenticated users by uid: an in-process TTL/LRU in front of Redis.
+    Invalidations are published so every worker drops its local entry.
+    The password hash is never cached. API and sqladmin writes invalidate
+    the user; other writes show up within `ttl` + `redis_ttl` seconds.
+    A user read from the database is stored only if it was not
+    invalidated since its lookup missed.
+    While Redis is unreachable, lookups fall through to the database and
+    invalidations are kept until `replay_invalidations`.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, redis_ttl: int) -> None:
+        self.local: TTLCache[str, UserPrincipal] = TTLCache(maxsize, ttl)
+        self.redis_ttl = redis_ttl
+        self.redis: Optional[aioredis.Redis] = None
+        self.breaker: Optional[CircuitBreaker] = None
+        self.pending: Set[str] = set()
+
+    def init(
+        self, redis: aioredis.Redis, breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        self.redis = redis
+        self.breaker = breaker
+        self.local.clear()
+        self.pending.clear()
+
+    async def _redis(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if self.breaker is None:
+            return await func(*args, **kwargs)
+        return await self.breaker.call(func, *args, **kwargs)
+
+    async def get(self, user_uid: UUID) -> Optional[User]:
+        key = str(user_uid)
+        principal = self.local.get(key)
+        if principal is not None:
+            PRINCIPAL_LOOKUPS.labels(tier="local").inc()
+            return User(**principal.model_dump())
+
+        if self.redis is None:
+            return None
+        try:
+            cached, generation = await self._redis(
+                self.redis.mget,
+                PRINCIPAL_KEY.format(user_uid=key),
+                PRINCIPAL_GENERATION_KEY.format(user_uid=key),
+            )
+        except (CircuitOpenError, *REDIS_FAILURES):
+            cached, generation = None, None
+        else:
+            generation = generation or b""
+        if cached is None:
+            PRINCIPAL_LOOKUPS.labels(tier="database").inc()
+            principal_generation.set((key, generation))
+            return None
+        PRINCIPAL_LOOKUPS.labels(tier="redis").inc()
+        principal = UserPrincipal.model_validate_json(cached)
+        self.local.set(key, principal)
+        return User(**principal.model_dump())
+
+    async def set(self, user: User) -> None:
+        """
+        Store `user` as read from the database after `get` missed it.
+        Nothing is stored when it was invalidated in the meantime. Without
+        a generation from `get`, as while Redis is unreachable, the user
+        is kept in this process only.
+        """
+        principal = UserPrincipal.model_validate(user)
+        key = str(user.uid)
+        seen = principal_generation.get()
+        principal_generation.set(None)
+        generation = seen[1] if seen is not None and seen[0] == key else None
+        if self.redis is None or generation is None:
+            self.local.set(key, principal)
+            return
+        try:
+            stored = await self._redis(
+                self.redis.eval,
+                STORE_PRINCIPAL_SCRIPT,
+                2,
+                PRINCIPAL_KEY.format(user_uid=key),
+                PRINCIPAL_GENERATION_KEY.format(user_uid=key),
+                principal.model_dump_json(),
+                self.redis_ttl,
+                generation,
+            )
+        except (CircuitOpenError, *REDIS_FAILURES):
+            stored = True
+        if stored:
+            self.local.set(key, principal)
+
+    async def invalidate(self, user_uid: UUID) -> None:
+        key = str(user_uid)
+        self.local.pop(key)
+        if self.redis is None:
+            return
+        try:
+            await self._redis(
+                self.redis.eval,
+                INVALIDATE_PRINCIPAL_SCRIPT,
+                2,
+                PRINCIPAL_KEY.format(user_uid=key),
+                PRINCIPAL_GENERATION_KEY.format(user_uid=key),
+                self.redis_ttl,
+            )
+            await self._redis(
+                self.redis.publish, PRINCIPAL_INVALIDATION_CHANNEL, key
+            )
+        except (CircuitOpenError, *REDIS_FAILURES) as ex:
+            self.pending.add(key)
+            logger.exception(ex)
+
+    async def replay_invalidations(self) -> None:
+        keys, self.pending = self.pending, set()
+        for key in keys:
+            await self.invalidate(UUID(key))
+
+    async def listen(self) -> None:
+        if self.redis is not None:
+            await subscribe(
+                self.redis, PRINCIPAL_INVALIDATION_CHANNEL, self.local.pop
+            )
+
+
+principal_cache = PrincipalCache(
+    maxsize=cache_settings.PRINCIPAL_CACHE_SIZE,
+    ttl=cache_settings.PRINCIPAL_CACHE_TTL,
+    redis_ttl=cache_settings.PRINCIPAL_CACHE_REDIS_TTL,
+)
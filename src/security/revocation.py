@@ -0,0 +1,182 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from redis import asyncio as aioredis
+
+from configs.config import jwt_settings
+from configs.loggers import logger
+from databases.redis_pool import REDIS_FAILURES
+from utilities.bloom import BloomFilter
+from utilities.circuit_breaker import CircuitBreaker
+from utilities.exceptions import CircuitOpenError
+from utilities.metrics import Counter
+from utilities.pubsub import subscribe
+
+REVOKED_TOKEN_KEY = "revoked-token:{jti}"
+REVOKED_TOKENS_KEY = "revoked-tokens"
+TOKEN_REVOCATION_CHANNEL = "token-revocation"
+
+TOKEN_REVOCATION_CHECKS = Counter(
+    "token_revocation_checks_total",
+    "Token revocation checks by outcome; only bloom hits reach Redis",
+    ["result"],
+)
+
+
+class TokenRevocationList:
+    """
+    Revoked token ids live in Redis until the token would have expired.
+    Every process mirrors them into a Bloom filter, kept current through
+    pub/sub and rebuilt every `refresh_interval` seconds, which also
+    drops expired ids. Redis is asked only about ids the filter matches.
+
+    Refresh tokens are tracked in Redis alone (see `redeem`): they are
+    only checked by /auth/refresh/, and keeping them in the filter would
+    raise its false positive rate for every access token check.
+
+    Redis calls go through `breaker`. While Redis is unreachable, access
+    tokens the filter matches count as revoked, and revoking or redeeming
+    tokens raises CircuitOpenError or one of REDIS_FAILURES.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        refresh_interval: int,
+        single_use_refresh: bool = False,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.single_use_refresh = single_use_refresh
+        self.filter = self._new_filter()
+        self.next_filter: Optional[BloomFilter] = None
+        self.redis: Optional[aioredis.Redis] = None
+        self.breaker: Optional[CircuitBreaker] = None
+        # Refresh token ids revoked while there is no Redis client
+        self.revoked_refresh: Set[str] = set()
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter(self.capacity, self.error_rate)
+
+    def init(
+        self, redis: aioredis.Redis, breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        self.redis = redis
+        self.breaker = breaker
+        self.filter = self._new_filter()
+        self.revoked_refresh.clear()
+
+    async def _redis(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if self.breaker is None:
+            return await func(*args, **kwargs)
+        return await self.breaker.call(func, *args, **kwargs)
+
+    def add(self, jti: str) -> None:
+        self.filter.add(jti)
+        if self.next_filter is not None:
+            self.next_filter.add(jti)
+
+    async def revoke(self, jti: str, expires_in: int) -> None:
+        self.add(jti)
+        if self.redis is None:
+            return
+        now = time.time()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(REVOKED_TOKEN_KEY.format(jti=jti), 1, ex=expires_in)
+            pipe.zadd(REVOKED_TOKENS_KEY, {jti: now + expires_in})
+            pipe.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", now)
+            pipe.publish(TOKEN_REVOCATION_CHANNEL, jti)
+            await self._redis(pipe.execute)
+
+    async def revoke_refresh(self, jti: str, expires_in: int) -> None:
+        if self.redis is None:
+            self.revoked_refresh.add(jti)
+            return
+        await self._redis(
+            self.redis.set, REVOKED_TOKEN_KEY.format(jti=jti), 1, ex=expires_in
+        )
+
+    async def redeem(self, jti: str, expires_in: int) -> bool:
+        """
+        Whether refresh token `jti` may be exchanged for new tokens. With
+        `single_use_refresh` it is also revoked, in a single SET NX, so of
+        concurrent refreshes with the same token only one succeeds.
+        """
+        if self.redis is None:
+            if jti in self.revoked_refresh:
+                return False
+            if self.single_use_refresh:
+                self.revoked_refresh.add(jti)
+            return True
+        key = REVOKED_TOKEN_KEY.format(jti=jti)
+        if self.single_use_refresh:
+            return bool(
+                await self._redis(
+                    self.redis.set, key, 1, nx=True, ex=expires_in
+                )
+            )
+        return not await self._redis(self.redis.exists, key)
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None or jti not in self.filter:
+            TOKEN_REVOCATION_CHECKS.labels(result="filtered").inc()
+            return False
+        if self.redis is None:
+            TOKEN_REVOCATION_CHECKS.labels(result="revoked").inc()
+            return True
+        try:
+            revoked = bool(
+                await self._redis(
+                    self.redis.exists, REVOKED_TOKEN_KEY.format(jti=jti)
+                )
+            )
+        except (CircuitOpenError, *REDIS_FAILURES):
+            # Fail closed: the filter says the token may be revoked
+            TOKEN_REVOCATION_CHECKS.labels(result="unavailable").inc()
+            return True
+        TOKEN_REVOCATION_CHECKS.labels(
+            result="revoked" if revoked else "false_positive"
+        ).inc()
+        return revoked
+
+    async def load(self) -> None:
+        """
+        Rebuilds the filter from Redis. At startup a failure leaves the
+        filter empty; `refresh` retries every `refresh_interval`.
+        """
+        if self.redis is None:
+            return
+        self.next_filter = self._new_filter()
+        try:
+            for jti in await self.redis.zrangebyscore(
+                REVOKED_TOKENS_KEY, time.time(), "+inf"
+            ):
+                self.next_filter.add(jti.decode())
+            self.filter = self.next_filter
+        finally:
+            self.next_filter = None
+
+    async def listen(self) -> None:
+        if self.redis is not None:
+            await subscribe(self.redis, TOKEN_REVOCATION_CHANNEL, self.add)
+
+    async def refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load()
+            except REDIS_FAILURES as ex:
+                logger.exception(ex)
+
+
+token_revocations = TokenRevocationList(
+    capacity=jwt_settings.JWT_REVOCATION_CAPACITY,
+    error_rate=jwt_settings.JWT_REVOCATION_ERROR_RATE,
+    refresh_interval=jwt_settings.JWT_REVOCATION_REFRESH_INTERVAL,
+    single_use_refresh=jwt_settings.JWT_REFRESH_TOKEN_SINGLE_USE,
+)
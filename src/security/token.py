@@ -3,6 +3,7 @@ from datetime import timedelta
 from fastapi_jwt import JwtAccessBearerCookie, JwtRefreshBearer
 
 from configs.config import jwt_settings
+from security.token_cache import CachedJWTBackend, access_token_cache
 
 access_security = JwtAccessBearerCookie(
     secret_key=jwt_settings.JWT_SECRET_KEY,
@@ -18,6 +19,11 @@ access_security_optional = JwtAccessBearerCookie(
     ),
 )
 
+for bearer in (access_security, access_security_optional):
+    bearer.jwt_backend = CachedJWTBackend(
+        bearer.jwt_backend, access_token_cache
+    )
+
 refresh_security = JwtRefreshBearer(
     secret_key=jwt_settings.JWT_SECRET_KEY,
     refresh_expires_delta=timedelta(
@@ -0,0 +1,98 @@
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi_jwt.jwt_backends.abstract_backend import AbstractJWTBackend
+
+from configs.config import cache_settings
+from utilities.lru import TTLCache
+from utilities.metrics import Counter
+
+Payload = Dict[str, Any]
+
+TOKEN_CACHE_LOOKUPS = Counter(
+    "token_cache_lookups_total",
+    "Verified-token cache lookups",
+    ["cache", "result"],
+)
+TOKEN_CACHE_SECONDS_SAVED = Counter(
+    "token_cache_seconds_saved_total",
+    "Estimated token verification time saved by cache hits",
+    ["cache"],
+)
+
+
+class VerifiedTokenCache:
+    """
+    LRU of decoded and verified tokens keyed by the token digest.
+    An entry lives until the token's `exp` or `ttl` seconds,
+    whichever comes first; failed verifications are never cached.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: int) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.tokens: TTLCache[bytes, Payload] = TTLCache(maxsize, ttl)
+        self.decode_seconds = 0.0
+        self.decodes = 0
+
+    def decode(self, token: str, decoder: Callable[[str], Payload]) -> Payload:
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self.tokens.get(key)
+        if payload is not None:
+            TOKEN_CACHE_LOOKUPS.labels(cache=self.name, result="hit").inc()
+            if self.decodes:
+                TOKEN_CACHE_SECONDS_SAVED.labels(cache=self.name).inc(
+                    self.decode_seconds / self.decodes
+                )
+            return payload
+
+        TOKEN_CACHE_LOOKUPS.labels(cache=self.name, result="miss").inc()
+        start = time.perf_counter()
+        payload = decoder(token)
+        self.decode_seconds += time.perf_counter() - start
+        self.decodes += 1
+
+        ttl = self.ttl
+        if payload and "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if payload and ttl > 0:
+            self.tokens.set(key, payload, ttl=ttl)
+        return payload
+
+    def clear(self) -> None:
+        self.tokens.clear()
+
+
+class CachedJWTBackend(AbstractJWTBackend):
+    """fastapi-jwt backend that verifies each token only once."""
+
+    def __init__(
+        self, backend: AbstractJWTBackend, cache: VerifiedTokenCache
+    ) -> None:
+        self.backend = backend
+        self.cache = cache
+
+    @property
+    def algorithm(self) -> str:
+        return self.backend.algorithm
+
+    def encode(self, to_encode: Payload, secret_key: str) -> str:
+        return self.backend.encode(to_encode, secret_key)
+
+    def decode(self, token: str, secret_key: str) -> Optional[Payload]:
+        return self.cache.decode(
+            token, lambda value: self.backend.decode(value, secret_key)
+        )
+
+
+access_token_cache = VerifiedTokenCache(
+    "access",
+    maxsize=cache_settings.TOKEN_CACHE_SIZE,
+    ttl=cache_settings.TOKEN_CACHE_TTL,
+)
+admin_token_cache = VerifiedTokenCache(
+    "admin",
+    maxsize=cache_settings.TOKEN_CACHE_SIZE,
+    ttl=cache_settings.TOKEN_CACHE_TTL,
+)
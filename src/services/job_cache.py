@@ -0,0 +1,65 @@
+from typing import Any, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import invalidate_tags
+from constants.job import JOBS_ALL_TAG, JOBS_AUTHOR_TAG, JOBS_PERFORMER_TAG
+from crud.job import crud_job
+from models import Job, User
+
+
+class JobParticipants(NamedTuple):
+    author_id: Optional[int]
+    performer_id: Optional[int]
+
+
+def author_jobs_tags(current_user: User, **_: Any) -> List[str]:
+    return [JOBS_AUTHOR_TAG.format(user_id=current_user.id)]
+
+
+def performer_jobs_tags(current_user: User, **_: Any) -> List[str]:
+    return [JOBS_PERFORMER_TAG.format(user_id=current_user.id)]
+
+
+def all_jobs_tags(**_: Any) -> List[str]:
+    return [JOBS_ALL_TAG]
+
+
+async def author_jobs_version(
+    db: AsyncSession, current_user: User, **_: Any
+) -> Any:
+    return await crud_job.get_author_version(db, author_id=current_user.id)
+
+
+async def performer_jobs_version(
+    db: AsyncSession, current_user: User, **_: Any
+) -> Any:
+    return await crud_job.get_performer_version(
+        db, performer_id=current_user.id
+    )
+
+
+async def job_version(db: AsyncSession, job_uid: UUID, **_: Any) -> Any:
+    return await crud_job.get_updated_at(db, uid=job_uid)
+
+
+async def invalidate_job_lists(
+    jobs: Iterable[Job],
+    previous_performer_ids: Iterable[Optional[int]] = (),
+) -> None:
+    """
+    Purge the cached lists that contain `jobs`: every job list, their
+    authors' and performers' lists, and the lists of the performers the
+    jobs were reassigned from.
+    """
+    tags = {JOBS_ALL_TAG}
+    for job in jobs:
+        tags.add(JOBS_AUTHOR_TAG.format(user_id=job.author_id))
+        tags.add(JOBS_PERFORMER_TAG.format(user_id=job.performer_id))
+    tags.update(
+        JOBS_PERFORMER_TAG.format(user_id=performer_id)
+        for performer_id in previous_performer_ids
+        if performer_id is not None
+    )
+    await invalidate_tags(*sorted(tags))
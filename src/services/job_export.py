@@ -0,0 +1,70 @@
+import csv
+import io
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from constants.job import EXPORT_BATCH_SIZE, ExportFormat
+from crud.job import crud_job
+from models import Job
+from schemas.job import JobResponse
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+EXPORT_FIELDS = list(JobResponse.model_fields)
+
+
+def encode_ndjson(jobs: List[Job]) -> str:
+    return "".join(
+        JobResponse.model_validate(job, from_attributes=True).model_dump_json()
+        + "\n"
+        for job in jobs
+    )
+
+
+def encode_csv(jobs: List[Job], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    if header:
+        writer.writeheader()
+    writer.writerows(
+        JobResponse.model_validate(job, from_attributes=True).model_dump(
+            mode="json"
+        )
+        for job in jobs
+    )
+    return buffer.getvalue()
+
+
+async def export_jobs(
+    session_maker: async_sessionmaker,
+    export_format: ExportFormat,
+    *,
+    author_id: Optional[int] = None,
+    performer_id: Optional[int] = None,
+    is_archived: Optional[bool] = None,
+    is_completed: Optional[bool] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield the export one batch at a time. The session is opened here
+    rather than taken from a dependency, because it has to stay open
+    while the response is being streamed.
+    """
+    async with session_maker() as db:
+        result = await crud_job.stream_filtered(
+            db,
+            author_id=author_id,
+            performer_id=performer_id,
+            is_archived=is_archived,
+            is_completed=is_completed,
+            batch_size=EXPORT_BATCH_SIZE,
+        )
+        if export_format == ExportFormat.csv:
+            yield encode_csv([], header=True)
+        async for jobs in result.partitions():
+            if export_format == ExportFormat.csv:
+                yield encode_csv(jobs)
+            else:
+                yield encode_ndjson(jobs)
@@ -14,6 +14,7 @@ from schemas.user import (
     UserUpdateDB,
 )
 from security.password import hash_password
+from security.principal_cache import principal_cache
 from crud.user import crud_user
 from models import User
 from utilities.exceptions import UserNameExistError
@@ -98,6 +99,7 @@ async def update_user(
             commit=False,
         )
         await db.commit()
+        await principal_cache.invalidate(updated_user.uid)
     except UserNameExistError as ex:
         await db.rollback()
         logger.exception(ex)
@@ -110,6 +112,26 @@ async def update_user(
     return updated_user
 
 
+async def rehash_password(
+    db: AsyncSession, found_user: User, hashed_password: str
+) -> None:
+    """
+    Store a hash made with the current cost after a successful login.
+    Failing to store it must not fail the login, the old hash stays valid.
+    """
+    try:
+        await crud_user.update(
+            db=db,
+            db_obj=found_user,
+            update_data={"hashed_password": hashed_password},
+            commit=False,
+        )
+        await db.commit()
+    except Exception as ex:
+        await db.rollback()
+        logger.exception(ex)
+
+
 async def generate_unique_username(
     db: AsyncSession, first_name: str, second_name: str
 ) -> str:
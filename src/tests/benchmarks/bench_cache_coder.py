@@ -0,0 +1,86 @@
+"""
+Bytes stored and encode/decode time of a cached job list with
+fastapi-cache's JsonCoder versus `compact_coder`.
+
+Run from `src/`:
+    python -m tests.benchmarks.bench_cache_coder --jobs 100 --count 200
+"""
+
+import argparse
+from random import Random
+import string
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import List
+
+from fastapi_cache.coder import Coder, JsonCoder
+
+from cache import COMPRESSORS, CODEC_HEADERS, compact_coder
+from models import Job
+from schemas.job import JobResponse
+from tests.benchmarks.utils import timer
+
+
+def make_jobs(count: int) -> List[Job]:
+    rng = Random(0)  # noqa: S311
+    now = datetime.now(UTC)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(500)
+    ]
+    return [
+        Job(
+            id=index,
+            uid=uuid.uuid4(),
+            title=" ".join(rng.choices(words, k=5)),
+            description=" ".join(rng.choices(words, k=120)),
+            author_id=rng.randint(1, 50),
+            performer_id=rng.randint(1, 50),
+            deadline=now + timedelta(days=index % 30),
+            created_at=now,
+            updated_at=now,
+            is_completed=False,
+            is_archived=False,
+        )
+        for index in range(count)
+    ]
+
+
+def measure(
+    name: str, coder: type[Coder], jobs: List[Job], count: int
+) -> None:
+    encode_results: List[float] = []
+    with timer(encode_results):
+        for _ in range(count):
+            encoded = coder.encode(jobs)
+    decode_results: List[float] = []
+    with timer(decode_results):
+        for _ in range(count):
+            coder.decode(encoded)
+    print(  # noqa: T201
+        f"{name:<24} {len(encoded):10d} bytes"
+        f"  encode {encode_results[0] / count * 1e3:8.3f} ms"
+        f"  decode {decode_results[0] / count * 1e3:8.3f} ms"
+    )
+
+
+def main(job_count: int, count: int) -> None:
+    jobs = make_jobs(job_count)
+    measure("JsonCoder", JsonCoder, jobs, count)
+    for compression, header in CODEC_HEADERS.items():
+        if compression != "none" and header not in COMPRESSORS:
+            continue
+        measure(
+            f"compact, {compression}",
+            compact_coder(List[JobResponse], compression=compression),
+            jobs,
+            count,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--count", type=int, default=200)
+    args = parser.parse_args()
+    main(args.jobs, args.count)
@@ -0,0 +1,66 @@
+"""
+Per-call overhead of rebuilding a select() versus the prebuilt
+bindparam statements used by the hot CRUD lookups.
+
+Run from `src/` against the test database:
+    python -m tests.benchmarks.bench_crud_statements --count 5000
+"""
+
+import argparse
+import asyncio
+import uuid
+
+from sqlalchemy import select
+
+from crud.user import crud_user
+from models import User
+from tests.benchmarks.utils import (
+    create_user,
+    prepared_database,
+    report,
+    timer,
+)
+
+
+def build_statement(uid: uuid.UUID) -> None:
+    select(User).where(User.uid == uid)._generate_cache_key()  # noqa: SLF001
+
+
+def prebuilt_statement() -> None:
+    crud_user.get_by_uid_statement._generate_cache_key()  # noqa: SLF001
+
+
+async def main(count: int) -> None:
+    uid = uuid.uuid4()
+    for name, call in (
+        ("build select() + cache key", lambda: build_statement(uid)),
+        ("prebuilt statement cache key", prebuilt_statement),
+    ):
+        results = []
+        with timer(results):
+            for _ in range(count):
+                call()
+        report(name, results, count)
+
+    async with prepared_database() as db:
+        user = await create_user(db, "bench_user")
+
+        results = []
+        with timer(results):
+            for _ in range(count):
+                statement = select(User).where(User.uid == user.uid)
+                (await db.execute(statement)).scalars().first()
+        report("get_by_uid, rebuilt select()", results, count)
+
+        results = []
+        with timer(results):
+            for _ in range(count):
+                await crud_user.get_by_uid(db, uid=user.uid)
+        report("get_by_uid, prebuilt statement", results, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.count))
@@ -0,0 +1,60 @@
+"""
+Compare N single `POST /job/` calls with one `POST /job/bulk/`.
+
+Run from `src/` against the test database:
+    python -m tests.benchmarks.bench_job_bulk_create --count 1000
+"""
+
+import argparse
+import asyncio
+
+from schemas.job import JobCreate
+from tests.benchmarks.utils import (
+    auth_headers,
+    benchmark_client,
+    create_user,
+    prepared_database,
+    report,
+    timer,
+)
+
+ROOT_ENDPOINT = "/api/v1/job/"
+
+
+async def main(count: int) -> None:
+    async with prepared_database() as db, benchmark_client() as client:
+        author = await create_user(db, "bench_author")
+        performer = await create_user(db, "bench_performer")
+        headers = auth_headers(author)
+        jobs = [
+            JobCreate(
+                title=f"job {i}",
+                description="benchmark job " * 20,
+                performer_id=performer.id,
+            ).model_dump(mode="json")
+            for i in range(count)
+        ]
+
+        single_results = []
+        with timer(single_results):
+            for job in jobs:
+                response = await client.post(
+                    ROOT_ENDPOINT, json=job, headers=headers
+                )
+                response.raise_for_status()
+        report(f"{count} x POST /job/", single_results, count)
+
+        bulk_results = []
+        with timer(bulk_results):
+            response = await client.post(
+                f"{ROOT_ENDPOINT}bulk/", json=jobs, headers=headers
+            )
+            response.raise_for_status()
+        report(f"1 x POST /job/bulk/ ({count} jobs)", bulk_results, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.count))
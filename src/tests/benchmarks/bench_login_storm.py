@@ -0,0 +1,102 @@
+"""
+Latency of an unrelated authenticated GET while a storm of logins is
+hashing passwords, with bcrypt on the hashing pool and inline on the
+event loop.
+
+Run from `src/` against the test database:
+    python -m tests.benchmarks.bench_login_storm --logins 200
+"""
+
+import argparse
+import asyncio
+import statistics
+from typing import Any, Callable, List, TypeVar
+
+from httpx import AsyncClient
+
+from security.password import password_hasher
+from tests.benchmarks.utils import (
+    auth_headers,
+    benchmark_client,
+    create_user,
+    prepared_database,
+    timer,
+)
+
+ResultT = TypeVar("ResultT")
+
+LOGIN_ENDPOINT = "/api/v1/auth/login/"
+ACCOUNT_ENDPOINT = "/api/v1/user/"
+
+
+async def run_inline(
+    operation: str, func: Callable[..., ResultT], *args: Any
+) -> ResultT:
+    return func(*args)
+
+
+def percentile(results: List[float], percent: int) -> float:
+    return statistics.quantiles(results, n=100)[percent - 1]
+
+
+async def probe(
+    client: AsyncClient, headers: dict, stop: asyncio.Event
+) -> List[float]:
+    results = []
+    while not stop.is_set():
+        with timer(results):
+            await client.get(ACCOUNT_ENDPOINT, headers=headers)
+        await asyncio.sleep(0.005)
+    return results
+
+
+async def storm(client: AsyncClient, email: str, logins: int) -> None:
+    await asyncio.gather(
+        *(
+            client.post(
+                LOGIN_ENDPOINT, json={"email": email, "password": "password"}
+            )
+            for _ in range(logins)
+        )
+    )
+
+
+async def measure(
+    client: AsyncClient, headers: dict, email: str, logins: int
+) -> List[float]:
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(client, headers, stop))
+    if logins:
+        await storm(client, email, logins)
+    else:
+        await asyncio.sleep(1)
+    stop.set()
+    return await probe_task
+
+
+async def main(logins: int) -> None:
+    async with prepared_database() as db, benchmark_client() as client:
+        user = await create_user(db, "bench_user")
+        headers = auth_headers(user)
+        await client.get(ACCOUNT_ENDPOINT, headers=headers)
+
+        scenarios = (
+            ("idle", 0, password_hasher.run),
+            ("login storm, hashing pool", logins, password_hasher.run),
+            ("login storm, inline bcrypt", logins, run_inline),
+        )
+        for name, count, run in scenarios:
+            password_hasher.run = run
+            results = await measure(client, headers, user.email, count)
+            print(  # noqa: T201
+                f"{name:<30} requests {len(results):6}"
+                f"  p50 {percentile(results, 50) * 1000:8.2f} ms"
+                f"  p99 {percentile(results, 99) * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
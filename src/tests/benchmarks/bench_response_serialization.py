@@ -0,0 +1,54 @@
+"""
+Time to turn ORM job rows into a `List[JobResponse]` response body:
+validated and dumped to Python objects encoded by JSONResponse, as
+FastAPI does by default, versus the v1 routes' `render_json` and
+FastJSONResponse.
+
+Run from `src/`:
+    python -m tests.benchmarks.bench_response_serialization --count 20
+"""
+
+import argparse
+from typing import Any, List
+
+from fastapi.responses import JSONResponse
+
+from api.responses import FastJSONResponse, render_json
+from schemas.job import JobResponse
+from tests.benchmarks.bench_cache_coder import make_jobs
+from tests.benchmarks.utils import timer
+from utilities.serialization import type_adapter
+
+
+def render_default(jobs: List[Any]) -> bytes:
+    adapter = type_adapter(List[JobResponse])
+    value = adapter.validate_python(jobs, from_attributes=True)
+    return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+
+def render_fast(jobs: List[Any]) -> bytes:
+    return FastJSONResponse(render_json(List[JobResponse], jobs)).body
+
+
+def main(count: int) -> None:
+    for job_count in (100, 1000, 10000):
+        jobs = make_jobs(job_count)
+        for name, render in (
+            ("default", render_default),
+            ("fast path", render_fast),
+        ):
+            results: List[float] = []
+            with timer(results):
+                for _ in range(count):
+                    render(jobs)
+            print(  # noqa: T201
+                f"{job_count:>6} jobs, {name:<10}"
+                f" {results[0] / count * 1e3:10.3f} ms per response"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20)
+    args = parser.parse_args()
+    main(args.count)
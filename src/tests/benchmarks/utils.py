@@ -0,0 +1,75 @@
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.user import crud_user
+from databases.database import async_engine, async_session
+from main import create_app, lifespan
+from models import User
+from models.base import Base
+from schemas.user import UserCreateDB
+from security.password import hash_password
+from security.token import access_security
+
+
+@asynccontextmanager
+async def prepared_database() -> AsyncIterator[AsyncSession]:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_session() as db:
+            yield db
+    finally:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await async_engine.dispose()
+
+
+@asynccontextmanager
+async def benchmark_client() -> AsyncIterator[AsyncClient]:
+    app = create_app()
+    async with (
+        lifespan(app),
+        AsyncClient(app=app, base_url="http://0.0.0.0:8000") as client,
+    ):
+        yield client
+
+
+async def create_user(db: AsyncSession, username: str) -> User:
+    return await crud_user.create(
+        db=db,
+        create_schema=UserCreateDB(
+            uid=uuid.uuid4(),
+            username=username,
+            hashed_password=await hash_password("password"),
+            first_name=username,
+            second_name=username,
+            email=f"{username}@gmail.com",
+        ),
+    )
+
+
+def auth_headers(user: User) -> dict:
+    access_token = access_security.create_access_token(
+        subject={"uid": str(user.uid)}
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+@contextmanager
+def timer(results: List[float]) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    results.append(time.perf_counter() - start)
+
+
+def report(name: str, results: List[float], count: int = 1) -> None:
+    total = sum(results)
+    print(  # noqa: T201
+        f"{name:<40} total {total * 1000:10.2f} ms"
+        f"  per item {total / count * 1e6:10.2f} us"
+    )
@@ -6,7 +6,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
-from databases.database import async_engine
+from databases.database import async_engine, replica_engine
 from main import lifespan, create_app
 from models import User
 from models.base import Base
@@ -37,6 +37,7 @@ async def async_session() -> AsyncSession:
         await conn.run_sync(Base.metadata.drop_all)
 
     await async_engine.dispose()
+    await replica_engine.dispose()
 
 
 @pytest_asyncio.fixture
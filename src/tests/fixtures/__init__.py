@@ -1,2 +1,4 @@
+from .database import *  # noqa: F403
 from .job import *  # noqa: F403
 from .user import *  # noqa: F403
+from .redis import *  # noqa: F403
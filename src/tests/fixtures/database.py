@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from databases.database import async_engine
+
+
+class CheckoutCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: Any) -> None:
+        self.count += 1
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, *args: Any) -> None:
+        _, _, statement, *_ = args
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def query_counter() -> Callable:
+    @contextmanager
+    def _query_counter(
+        engine: AsyncEngine = async_engine,
+    ) -> Iterator[QueryCounter]:
+        counter = QueryCounter()
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", counter)
+        try:
+            yield counter
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", counter)
+
+    return _query_counter
+
+
+@pytest.fixture
+def checkout_counter() -> Callable:
+    @contextmanager
+    def _checkout_counter(
+        engine: AsyncEngine = async_engine,
+    ) -> Iterator[CheckoutCounter]:
+        counter = CheckoutCounter()
+        pool = engine.sync_engine.pool
+        event.listen(pool, "checkout", counter)
+        try:
+            yield counter
+        finally:
+            event.remove(pool, "checkout", counter)
+
+    return _checkout_counter
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest_asyncio
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from configs.config import redis_settings
+from databases.redis_pool import InstrumentedPipeline, InstrumentedRedis
+
+
+class FaultyRedis(InstrumentedRedis):
+    """
+    Real Redis client that can be made slow (`delay` seconds before every
+    command) or unreachable (`down`), to exercise the circuit breaker.
+    """
+
+    delay: float = 0
+    down: bool = False
+
+    async def fault(self) -> None:
+        if self.down:
+            msg = "Redis is down"
+            raise RedisConnectionError(msg)
+        await asyncio.sleep(self.delay)
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        await self.fault()
+        return await super().execute_command(*args, **options)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> InstrumentedPipeline:
+        return FaultyPipeline(
+            self,
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+
+
+class FaultyPipeline(InstrumentedPipeline):
+    def __init__(self, client: FaultyRedis, *args: Any) -> None:
+        super().__init__(*args)
+        self.client = client
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        await self.client.fault()
+        return await super().execute(raise_on_error)
+
+
+@pytest_asyncio.fixture
+async def faulty_redis() -> FaultyRedis:
+    client = FaultyRedis.from_url(redis_settings.url)
+    yield client
+    client.delay, client.down = 0, False
+    await client.aclose()
@@ -0,0 +1,305 @@
+import asyncio
+from typing import Callable
+
+import pytest
+from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.config import password_settings
+from databases.redis_pool import redis_breaker
+from main import create_app, lifespan
+from models import User
+from security.revocation import token_revocations
+from security.password import pwd_context
+from utilities.bloom import BloomFilter
+
+ROOT_ENDPOINT = "/api/v1/auth/"
+
+
+class FullBloomFilter(BloomFilter):
+    def __contains__(self, item: str) -> bool:
+        return True
+
+
+class TestAuth:
+    async def test_login(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+    ):
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        assert response.status_code == 200
+        assert response.json()["access_token"]
+
+    async def test_login_with_wrong_password(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+    ):
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "wrong_password"},
+        )
+        assert response.status_code == 401
+
+    async def test_login_rehashes_outdated_password_hash(
+        self,
+        http_client: AsyncClient,
+        async_session: AsyncSession,
+        user_fixture: User,
+        query_counter: Callable,
+    ):
+        outdated_rounds = password_settings.PASSWORD_HASH_ROUNDS - 1
+        user_fixture.hashed_password = pwd_context.copy(
+            bcrypt__rounds=outdated_rounds
+        ).hash("password")
+        await async_session.commit()
+
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        assert response.status_code == 200
+
+        await async_session.refresh(user_fixture)
+        assert not pwd_context.needs_update(user_fixture.hashed_password)
+        assert pwd_context.verify("password", user_fixture.hashed_password)
+
+        with query_counter() as counter:
+            response = await http_client.post(
+                f"{ROOT_ENDPOINT}login/",
+                json={"email": user_fixture.email, "password": "password"},
+            )
+        assert response.status_code == 200
+        assert counter.count == 1
+
+    async def test_logout_revokes_access_token(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            "/api/v1/user/", headers=user_auth_headers
+        )
+        assert response.status_code == 200
+
+        response = await http_client.delete(
+            f"{ROOT_ENDPOINT}logout/", headers=user_auth_headers
+        )
+        assert response.is_success
+
+        response = await http_client.get(
+            "/api/v1/user/", headers=user_auth_headers
+        )
+        assert response.status_code == 401
+
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(
+            "/api/v1/user/", headers=user_2_auth_headers
+        )
+        assert response.status_code == 200
+
+    async def test_logout_revokes_refresh_token(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+    ):
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        tokens = response.json()
+
+        response = await http_client.delete(
+            f"{ROOT_ENDPOINT}logout/",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        assert response.is_success
+
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}refresh/",
+            headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+        )
+        assert response.status_code == 401
+
+    async def test_refresh_token_can_be_reused(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+    ):
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        refresh_headers = {
+            "Authorization": f"Bearer {response.json()['refresh_token']}"
+        }
+
+        for _ in range(2):
+            response = await http_client.post(
+                f"{ROOT_ENDPOINT}refresh/", headers=refresh_headers
+            )
+            assert response.status_code == 200
+
+    async def test_refresh_token_is_single_use(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(token_revocations, "single_use_refresh", True)
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        refresh_headers = {
+            "Authorization": f"Bearer {response.json()['refresh_token']}"
+        }
+
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}refresh/", headers=refresh_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["refresh_token"]
+
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}refresh/", headers=refresh_headers
+        )
+        assert response.status_code == 401
+
+    async def test_concurrent_refreshes_issue_one_token_pair(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(token_revocations, "single_use_refresh", True)
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        refresh_headers = {
+            "Authorization": f"Bearer {response.json()['refresh_token']}"
+        }
+
+        responses = await asyncio.gather(
+            *(
+                http_client.post(
+                    f"{ROOT_ENDPOINT}refresh/", headers=refresh_headers
+                )
+                for _ in range(5)
+            )
+        )
+        assert sorted(r.status_code for r in responses) == [
+            200,
+            401,
+            401,
+            401,
+            401,
+        ]
+
+    async def test_refreshes_do_not_fill_revocation_filter(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(token_revocations, "single_use_refresh", True)
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        refresh_token = response.json()["refresh_token"]
+        filter_before = bytes(token_revocations.filter.bits)
+
+        for _ in range(3):
+            response = await http_client.post(
+                f"{ROOT_ENDPOINT}refresh/",
+                headers={"Authorization": f"Bearer {refresh_token}"},
+            )
+            assert response.status_code == 200
+            refresh_token = response.json()["refresh_token"]
+
+        assert bytes(token_revocations.filter.bits) == filter_before
+
+    async def test_logout_and_refresh_while_redis_is_down(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+    ):
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}login/",
+            json={"email": user_fixture.email, "password": "password"},
+        )
+        tokens = response.json()
+
+        redis_breaker.trip()
+        try:
+            response = await http_client.post(
+                f"{ROOT_ENDPOINT}refresh/",
+                headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+            )
+            assert response.status_code == 503
+            response = await http_client.delete(
+                f"{ROOT_ENDPOINT}logout/",
+                headers={"Authorization": f"Bearer {tokens['access_token']}"},
+            )
+            assert response.status_code == 503
+        finally:
+            redis_breaker.close()
+
+    async def test_filter_hits_count_as_revoked_while_redis_is_down(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            "/api/v1/user/", headers=user_auth_headers
+        )
+        assert response.status_code == 200
+
+        token_revocations.filter = FullBloomFilter(1, 0.5)
+        redis_breaker.trip()
+        try:
+            response = await http_client.get(
+                "/api/v1/user/", headers=user_auth_headers
+            )
+            assert response.status_code == 401
+        finally:
+            redis_breaker.close()
+            token_revocations.filter = token_revocations._new_filter()  # noqa: SLF001
+
+    async def test_revoked_tokens_survive_filter_rebuild(
+        self,
+        http_client: AsyncClient,
+    ):
+        jti = "revoked-jti"
+        await token_revocations.revoke(jti, expires_in=60)
+        token_revocations.filter = token_revocations._new_filter()  # noqa: SLF001
+        assert not await token_revocations.is_revoked(jti)
+
+        await token_revocations.load()
+        assert await token_revocations.is_revoked(jti)
+        assert not await token_revocations.is_revoked("unknown-jti")
+
+    async def test_startup_survives_redis_outage(
+        self,
+        async_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        async def load() -> None:
+            msg = "Redis is down"
+            raise RedisConnectionError(msg)
+
+        monkeypatch.setattr(token_revocations, "load", load)
+        async with lifespan(create_app()):
+            assert not await token_revocations.is_revoked("any-jti")
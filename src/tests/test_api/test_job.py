@@ -1,10 +1,27 @@
+import asyncio
+import csv
+import json
+import time
+from datetime import datetime, UTC, timedelta
 from typing import Callable
 from uuid import uuid4
 
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import CACHE_REQUESTS
+from crud.job import crud_job
+from databases.database import replica_engine
+from databases.redis_pool import redis_breaker
 from models import Job, User
-from schemas.job import JobCreate, JobUpdate, JobUpdateForPerformer
+from schemas.job import (
+    JobCreate,
+    JobCreateDB,
+    JobUpdate,
+    JobUpdateForPerformer,
+)
+from security.principal_cache import principal_cache
+from utilities.metrics import metric_value
 
 ROOT_ENDPOINT = "/api/v1/job/"
 
@@ -26,6 +43,452 @@ class TestJob:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
+    async def test_get_author_jobs_cache_is_per_user(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "author/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        hits = metric_value(
+            CACHE_REQUESTS, endpoint="get_author_jobs", result="hit"
+        )
+
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert len(response.json()) == 1
+
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert response.json() == []
+
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.headers["X-FastAPI-Cache"] == "HIT"
+        assert len(response.json()) == 1
+        assert (
+            metric_value(
+                CACHE_REQUESTS, endpoint="get_author_jobs", result="hit"
+            )
+            == hits + 1
+        )
+
+    async def test_get_author_jobs_bypasses_cache_while_redis_is_down(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "author/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        bypassed = metric_value(
+            CACHE_REQUESTS, endpoint="get_author_jobs", result="bypass"
+        )
+
+        redis_breaker.trip()
+        try:
+            for _ in range(2):
+                response = await http_client.get(
+                    endpoint, headers=user_auth_headers
+                )
+                assert response.status_code == 200
+                assert response.headers["X-FastAPI-Cache"] == "MISS"
+                assert len(response.json()) == 1
+        finally:
+            redis_breaker.close()
+
+        assert (
+            metric_value(
+                CACHE_REQUESTS, endpoint="get_author_jobs", result="bypass"
+            )
+            == bypassed + 2
+        )
+
+    async def test_get_all_jobs_cache_key_uses_query_params(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "all/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(
+            endpoint, params={"limit": 1}, headers=user_auth_headers
+        )
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert len(response.json()) == 1
+
+        response = await http_client.get(
+            endpoint, params={"limit": 2}, headers=user_auth_headers
+        )
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert len(response.json()) == 2
+
+        response = await http_client.get(
+            endpoint, params={"limit": 1}, headers=user_auth_headers
+        )
+        assert response.headers["X-FastAPI-Cache"] == "HIT"
+        assert len(response.json()) == 1
+
+    async def test_concurrent_cache_misses_query_once(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        query_counter: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "all/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        await http_client.get("/api/v1/user/", headers=user_auth_headers)
+
+        with query_counter(replica_engine) as counter:
+            responses = await asyncio.gather(
+                *(
+                    http_client.get(endpoint, headers=user_auth_headers)
+                    for _ in range(5)
+                )
+            )
+        assert [len(response.json()) for response in responses] == [1] * 5
+        assert counter.count == 1
+
+    async def test_create_job_invalidates_cached_lists(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        for endpoint, headers in (
+            (ROOT_ENDPOINT + "author/", user_auth_headers),
+            (ROOT_ENDPOINT + "performer/", user_2_auth_headers),
+            (ROOT_ENDPOINT + "all/", user_auth_headers),
+        ):
+            response = await http_client.get(endpoint, headers=headers)
+            assert len(response.json()) == 1
+
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            json=JobCreate(
+                title="new", description="new", performer_id=user_fixture_2.id
+            ).model_dump(),
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 201
+
+        for endpoint, headers in (
+            (ROOT_ENDPOINT + "author/", user_auth_headers),
+            (ROOT_ENDPOINT + "performer/", user_2_auth_headers),
+            (ROOT_ENDPOINT + "all/", user_auth_headers),
+        ):
+            response = await http_client.get(endpoint, headers=headers)
+            assert response.headers["X-FastAPI-Cache"] == "MISS"
+            assert len(response.json()) == 2
+
+    async def test_reassign_job_invalidates_both_performers(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        user_fixture_3: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "performer/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        user_3_auth_headers = await get_auth_headers(user_fixture_3)
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        assert len(response.json()) == 1
+        response = await http_client.get(endpoint, headers=user_3_auth_headers)
+        assert response.json() == []
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}author/{job_fixture.uid}/",
+            json={"performer_id": user_fixture_3.id},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        assert response.json() == []
+        response = await http_client.get(endpoint, headers=user_3_auth_headers)
+        assert [job["uid"] for job in response.json()] == [
+            str(job_fixture.uid)
+        ]
+
+    async def test_admin_reassign_job_invalidates_previous_performer(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        user_fixture_3: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "performer/"
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        admin_auth_headers = await get_auth_headers(user_fixture_3)
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        assert len(response.json()) == 1
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}admin/{job_fixture.uid}/",
+            json={"performer_id": user_fixture.id},
+            headers=admin_auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["performer_id"] == user_fixture.id
+
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert response.json() == []
+
+    async def test_delete_job_invalidates_cached_lists(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "author/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert len(response.json()) == 1
+
+        response = await http_client.delete(
+            f"{ROOT_ENDPOINT}{job_fixture.uid}/", headers=user_auth_headers
+        )
+        assert response.status_code == 204
+
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.json() == []
+
+    async def test_get_author_jobs_not_modified(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        query_counter: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "author/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        etag = response.headers["ETag"]
+
+        with query_counter(replica_engine) as counter:
+            response = await http_client.get(
+                endpoint, headers={**user_auth_headers, "If-None-Match": etag}
+            )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert counter.count == 1
+
+    async def test_job_list_etag_and_body_share_a_version(
+        self,
+        http_client: AsyncClient,
+        async_session: AsyncSession,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "author/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        etag = response.headers["ETag"]
+
+        # A write whose invalidation has not reached the cache yet
+        await crud_job.create(
+            db=async_session,
+            create_schema=JobCreateDB(
+                title="Not invalidated",
+                description="Test description",
+                deadline=datetime.now(tz=UTC) + timedelta(days=5),
+                author_id=user_fixture.id,
+                performer_id=user_fixture_2.id,
+                uid=uuid4(),
+            ),
+        )
+        response = await http_client.get(
+            endpoint, headers={**user_auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert len(response.json()) == 2
+
+    async def test_job_list_etag_changes_with_jobs_and_user(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "performer/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(endpoint, headers=user_2_auth_headers)
+        etag = response.headers["ETag"]
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.headers["ETag"] != etag
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}author/{job_fixture.uid}/",
+            json={"title": "changed"},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+
+        response = await http_client.get(
+            endpoint, headers={**user_2_auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["title"] == "changed"
+
+    async def test_get_jobs_page(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "page/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(
+            endpoint,
+            params={"limit": 1},
+            headers=user_auth_headers,
+        )
+        first_page = response.json()
+        assert response.status_code == 200
+        assert len(first_page["items"]) == 1
+        assert first_page["next_cursor"]
+
+        response = await http_client.get(
+            endpoint,
+            params={"limit": 1, "cursor": first_page["next_cursor"]},
+            headers=user_auth_headers,
+        )
+        second_page = response.json()
+        assert response.status_code == 200
+        assert len(second_page["items"]) == 1
+        assert second_page["next_cursor"] is None
+        assert {
+            first_page["items"][0]["uid"],
+            second_page["items"][0]["uid"],
+        } == {str(job_fixture.uid), str(job_fixture_2.uid)}
+
+    async def test_get_jobs_page_with_invalid_cursor(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "page/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(
+            endpoint,
+            params={"cursor": "not-a-cursor"},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 400
+
+    async def test_repeated_failing_requests_do_not_wait_for_refill(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "page/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        start = time.perf_counter()
+        for _ in range(3):
+            response = await http_client.get(
+                endpoint,
+                params={"cursor": "not-a-cursor"},
+                headers=user_auth_headers,
+            )
+            assert response.status_code == 400
+        assert time.perf_counter() - start < 1
+
+    async def test_export_jobs_ndjson(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "export/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(
+            endpoint,
+            params={"author_id": user_fixture.id},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["uid"] for row in rows] == [
+            str(job_fixture.uid),
+            str(job_fixture_2.uid),
+        ]
+
+    async def test_export_jobs_csv_with_filters(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = ROOT_ENDPOINT + "export/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(
+            endpoint,
+            params={"format": "csv", "is_completed": False},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        rows = list(csv.DictReader(response.text.splitlines()))
+        assert {row["title"] for row in rows} == {
+            job_fixture.title,
+            job_fixture_2.title,
+        }
+
+        response = await http_client.get(
+            endpoint,
+            params={"format": "csv", "performer_id": user_fixture.id},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        assert list(csv.DictReader(response.text.splitlines())) == []
+
     async def test_get_job_by_uid(
         self,
         http_client: AsyncClient,
@@ -41,6 +504,83 @@ class TestJob:
         assert response.status_code == 200
         assert response_data["uid"] == str(job_fixture.uid)
 
+    async def test_get_job_by_uid_not_modified(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.uid}/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        etag = response.headers["ETag"]
+
+        response = await http_client.get(
+            endpoint, headers={**user_auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}author/{job_fixture.uid}/",
+            json={"title": "changed"},
+            headers=user_auth_headers,
+        )
+        response = await http_client.get(
+            endpoint, headers={**user_auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "changed"
+
+    async def test_get_job_by_uid_reads_from_replica(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        query_counter: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.uid}/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        with query_counter(replica_engine) as counter:
+            response = await http_client.get(
+                endpoint, headers=user_auth_headers
+            )
+        assert response.status_code == 200
+        assert counter.count > 0
+
+    async def test_get_job_by_uid_after_write_reads_from_primary(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        query_counter: Callable,
+        checkout_counter: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.uid}/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}author/{job_fixture.uid}/",
+            json={"title": "for test"},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        await principal_cache.invalidate(user_fixture.uid)
+
+        with (
+            query_counter(replica_engine) as counter,
+            checkout_counter() as checkouts,
+        ):
+            response = await http_client.get(
+                endpoint, headers=user_auth_headers
+            )
+        assert response.status_code == 200
+        assert response.json()["title"] == "for test"
+        assert counter.count == 0
+        assert checkouts.count == 1
+
     async def test_get_job_by_wrong_uid(
         self,
         http_client: AsyncClient,
@@ -91,20 +631,78 @@ class TestJob:
         user_fixture: User,
         user_fixture_2: User,
         get_auth_headers: Callable,
+        query_counter: Callable,
     ):
         user_auth_headers = await get_auth_headers(user_fixture)
         new_job_schema = JobCreate(
             title="test", description="test", performer_id=user_fixture_2.id
         )
+        with query_counter() as counter:
+            response = await http_client.post(
+                ROOT_ENDPOINT,
+                json=new_job_schema.model_dump(),
+                headers=user_auth_headers,
+            )
+        assert response.status_code == 201
+        assert counter.count == 2
+
+        response_data = response.json()
+        assert response_data["title"] == "test"
+
+    async def test_create_jobs_bulk(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        new_jobs = [
+            JobCreate(
+                title=f"test {i}",
+                description="test",
+                performer_id=user_fixture_2.id,
+                deadline=datetime.now(tz=UTC) + timedelta(days=i)
+                if i % 2
+                else None,
+            ).model_dump(mode="json", exclude_unset=True)
+            for i in range(5)
+        ]
         response = await http_client.post(
-            ROOT_ENDPOINT,
-            json=new_job_schema.model_dump(),
+            f"{ROOT_ENDPOINT}bulk/",
+            json=new_jobs,
             headers=user_auth_headers,
         )
         assert response.status_code == 201
 
         response_data = response.json()
-        assert response_data["title"] == "test"
+        assert [job["title"] for job in response_data] == [
+            f"test {i}" for i in range(5)
+        ]
+        assert all(
+            job["author_id"] == user_fixture.id for job in response_data
+        )
+
+    async def test_create_jobs_bulk_with_wrong_performer(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        new_jobs = [
+            JobCreate(
+                title="test", description="test", performer_id=performer_id
+            ).model_dump()
+            for performer_id in (user_fixture_2.id, 9999)
+        ]
+        response = await http_client.post(
+            f"{ROOT_ENDPOINT}bulk/",
+            json=new_jobs,
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 404
 
     async def test_update_job_by_author(
         self,
@@ -113,19 +711,41 @@ class TestJob:
         job_fixture_2: Job,
         user_fixture: User,
         get_auth_headers: Callable,
+        query_counter: Callable,
+        checkout_counter: Callable,
     ):
         endpoint = f"{ROOT_ENDPOINT}author/{job_fixture.uid}/"
         user_auth_headers = await get_auth_headers(user_fixture)
         update_schema = JobUpdate(title="for test")
+        with query_counter() as counter, checkout_counter() as checkouts:
+            response = await http_client.patch(
+                endpoint,
+                json=update_schema.model_dump(),
+                headers=user_auth_headers,
+            )
+        assert response.status_code == 200
+        assert counter.count == 2
+        assert checkouts.count == 1
+
+        response_data = response.json()
+        assert response_data["title"] == "for test"
+
+    async def test_update_job_by_author_with_wrong_uid(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}author/{uuid4()}/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        update_schema = JobUpdate(title="for test")
         response = await http_client.patch(
             endpoint,
             json=update_schema.model_dump(),
             headers=user_auth_headers,
         )
-        assert response.status_code == 200
-
-        response_data = response.json()
-        assert response_data["title"] == "for test"
+        assert response.status_code == 404
 
     async def test_update_job_by_admin(
         self,
@@ -148,6 +768,62 @@ class TestJob:
         response_data = response.json()
         assert response_data["title"] == "for test"
 
+    async def test_update_jobs_bulk_by_admin(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        user_fixture_3: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}admin/bulk/"
+        user_auth_headers = await get_auth_headers(user_fixture_3)
+        missing_uid = uuid4()
+        update_data = [
+            {"uid": str(job_fixture.uid), "title": "first"},
+            {
+                "uid": str(job_fixture_2.uid),
+                "performer_id": user_fixture.id,
+                "is_archived": True,
+            },
+            {"uid": str(missing_uid), "title": "missing"},
+        ]
+        response = await http_client.patch(
+            endpoint, json=update_data, headers=user_auth_headers
+        )
+        assert response.status_code == 200
+
+        first, second, missing = response.json()
+        assert first["status"] == "updated"
+        assert first["job"]["title"] == "first"
+        assert first["job"]["description"] == job_fixture.description
+        assert second["status"] == "updated"
+        assert second["job"]["title"] == job_fixture_2.title
+        assert second["job"]["performer_id"] == user_fixture.id
+        assert second["job"]["is_archived"] is True
+        assert missing == {
+            "uid": str(missing_uid),
+            "status": "not_found",
+            "job": None,
+        }
+
+    async def test_update_jobs_bulk_by_not_admin(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}admin/bulk/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.patch(
+            endpoint,
+            json=[{"uid": str(job_fixture.uid), "title": "for test"}],
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 403
+
     async def test_update_author_job_by_unauthorized(
         self,
         http_client: AsyncClient,
@@ -173,16 +849,20 @@ class TestJob:
         job_fixture_2: Job,
         user_fixture_2: User,
         get_auth_headers: Callable,
+        query_counter: Callable,
     ):
         endpoint = f"{ROOT_ENDPOINT}performer/{job_fixture.uid}/"
         user_auth_headers = await get_auth_headers(user_fixture_2)
         update_schema = JobUpdateForPerformer(is_completed=True)
-        response = await http_client.patch(
-            endpoint,
-            json=update_schema.model_dump(),
-            headers=user_auth_headers,
-        )
+        with query_counter() as counter:
+            response = await http_client.patch(
+                endpoint,
+                json=update_schema.model_dump(),
+                headers=user_auth_headers,
+            )
         assert response.status_code == 200
+        assert counter.count == 2
+        assert response.json()["is_completed"] is True
 
     async def test_update_performer_job_by_unauthorized(
         self,
@@ -208,13 +888,62 @@ class TestJob:
         job_fixture: Job,
         user_fixture: User,
         get_auth_headers: Callable,
+        query_counter: Callable,
     ):
         endpoint = f"{ROOT_ENDPOINT}{job_fixture.uid}/"
         user_auth_headers = await get_auth_headers(user_fixture)
-        response = await http_client.delete(
-            endpoint, headers=user_auth_headers
-        )
+        with query_counter() as counter:
+            response = await http_client.delete(
+                endpoint, headers=user_auth_headers
+            )
         assert response.status_code == 204
+        assert counter.count == 2
+
+    async def test_delete_jobs_bulk(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        job_fixture_2: Job,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}bulk/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        missing_uid = uuid4()
+        response = await http_client.request(
+            "DELETE",
+            endpoint,
+            json=[str(job_fixture.uid), str(missing_uid)],
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()] == [
+            "deleted",
+            "not_found",
+        ]
+
+        response = await http_client.get(
+            f"{ROOT_ENDPOINT}{job_fixture.uid}/", headers=user_auth_headers
+        )
+        assert response.status_code == 404
+
+    async def test_delete_jobs_bulk_by_unauthorized(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}bulk/"
+        user_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.request(
+            "DELETE",
+            endpoint,
+            json=[str(job_fixture.uid)],
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["status"] == "forbidden"
 
     async def test_delete_job_with_wrong_uid(
         self,
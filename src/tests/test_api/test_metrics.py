@@ -0,0 +1,44 @@
+from typing import Callable
+
+from httpx import AsyncClient
+
+from models import User
+
+
+class TestMetrics:
+    async def test_pool_metrics(
+        self,
+        http_client: AsyncClient,
+        user_fixture_3: User,
+        get_auth_headers: Callable,
+    ):
+        admin_auth_headers = await get_auth_headers(user_fixture_3)
+        response = await http_client.get(
+            "/api/v1/user/", headers=admin_auth_headers
+        )
+        assert response.status_code == 200
+
+        response = await http_client.get(
+            "/metrics", headers=admin_auth_headers
+        )
+        assert response.status_code == 200
+        assert 'db_pool_checkout_seconds_count{pool="primary"}' in (
+            response.text
+        )
+        assert 'db_pool_connections{pool="primary",state="in_use"}' in (
+            response.text
+        )
+        assert 'db_pool_size{pool="primary"} 70.0' in response.text
+
+    async def test_metrics_require_admin(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        response = await http_client.get("/metrics")
+        assert response.status_code == 401
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get("/metrics", headers=user_auth_headers)
+        assert response.status_code == 403
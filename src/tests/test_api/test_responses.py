@@ -0,0 +1,84 @@
+import uuid
+from datetime import UTC, datetime
+from typing import List
+
+from fastapi import APIRouter, FastAPI, status
+from httpx import AsyncClient
+from starlette.responses import Response
+
+from api.responses import FastJSONResponse, FastJSONRoute
+from models import Job
+from schemas.job import JobResponse
+from utilities.serialization import RawJSON
+
+
+def make_job() -> Job:
+    now = datetime.now(UTC)
+    return Job(
+        id=1,
+        uid=uuid.uuid4(),
+        title="title",
+        description="description",
+        author_id=1,
+        performer_id=2,
+        deadline=None,
+        created_at=now,
+        updated_at=now,
+        is_completed=False,
+        is_archived=None,
+    )
+
+
+def make_app(jobs: List[Job]) -> FastAPI:
+    fast_router = APIRouter(route_class=FastJSONRoute)
+    default_router = APIRouter()
+
+    @fast_router.get("/jobs/", response_model=List[JobResponse])
+    @default_router.get("/jobs/", response_model=List[JobResponse])
+    async def get_jobs() -> List[Job]:
+        return jobs
+
+    @fast_router.post(
+        "/jobs/",
+        response_model=JobResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_job(response: Response) -> Job:
+        response.headers["X-Job"] = "created"
+        return jobs[0]
+
+    app = FastAPI()
+    app.include_router(
+        fast_router, prefix="/fast", default_response_class=FastJSONResponse
+    )
+    app.include_router(default_router, prefix="/default")
+    return app
+
+
+class TestResponses:
+    async def test_fast_route_matches_default_serialization(self):
+        app = make_app([make_job()])
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            fast = await client.get("/fast/jobs/")
+            default = await client.get("/default/jobs/")
+
+        assert fast.status_code == default.status_code == 200
+        assert fast.json() == default.json()
+        fast_route = next(
+            route for route in app.routes if route.path == "/fast/jobs/"
+        )
+        assert fast_route.endpoint.__fast_json__
+
+    async def test_fast_route_keeps_status_code_and_headers(self):
+        app = make_app([make_job()])
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post("/fast/jobs/")
+
+        assert response.status_code == 201
+        assert response.headers["X-Job"] == "created"
+        assert response.json()["title"] == "title"
+
+    def test_raw_json_is_sent_as_is(self):
+        body = FastJSONResponse(RawJSON(b'{"title":"title"}')).body
+
+        assert body == b'{"title":"title"}'
@@ -1,10 +1,14 @@
 from typing import Callable
 from uuid import uuid4
 
+from fastapi_cache import FastAPICache
 from httpx import AsyncClient
 
-from models import User
+from api.admin.views.user import UserAdmin
+from cache import CompactCoder
+from models import Job, User
 from schemas.user import UserUpdateDB, UserCreate, UserUpdateFullDB
+from security.principal_cache import principal_cache
 
 ROOT_ENDPOINT = "/api/v1/user/"
 
@@ -25,6 +29,61 @@ class TestUser:
         assert response.status_code == 200
         assert response_data["id"] == user_fixture.id
 
+    async def test_get_user_account_cached_principal(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        query_counter: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            ROOT_ENDPOINT, headers=user_auth_headers
+        )
+        assert response.status_code == 200
+
+        with query_counter() as counter:
+            response = await http_client.get(
+                ROOT_ENDPOINT, headers=user_auth_headers
+            )
+        assert response.status_code == 200
+        assert response.json()["uid"] == str(user_fixture.uid)
+        assert counter.count == 0
+
+    async def test_admin_grant_invalidates_cached_principal(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_3: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        admin_auth_headers = await get_auth_headers(user_fixture_3)
+        response = await http_client.get(
+            f"{ROOT_ENDPOINT}all/", headers=admin_auth_headers
+        )
+        assert response.status_code == 200
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}{user_fixture_3.uid}/",
+            json={"is_admin": True},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 403
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}{user_fixture.uid}/",
+            json={"is_admin": True},
+            headers=admin_auth_headers,
+        )
+        assert response.status_code == 200
+
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}{user_fixture_3.uid}/",
+            json={"is_admin": True},
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200
+
     async def test_get_user_by_uid(
         self,
         http_client: AsyncClient,
@@ -53,6 +112,60 @@ class TestUser:
         response = await http_client.get(endpoint, headers=user_auth_headers)
         assert response.status_code == 200
 
+    async def test_get_users_all_cached_without_private_fields(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}all/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        cached = await http_client.get(endpoint, headers=user_auth_headers)
+        assert cached.headers["X-FastAPI-Cache"] == "HIT"
+        assert cached.json() == response.json()
+        assert "hashed_password" not in cached.json()[0]
+
+        redis = FastAPICache.get_backend().redis
+        keys = [
+            key
+            for key in await redis.keys("fastapi-cache::get_all_users:*")
+            if not key.endswith(b":lock")
+        ]
+        assert keys
+        for key in keys:
+            entry = CompactCoder.unpack(await redis.get(key))
+            assert b"hashed_password" not in entry
+
+    async def test_get_users_page(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}page/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+
+        seen_uids, params = [], {"limit": 1}
+        while True:
+            response = await http_client.get(
+                endpoint, params=params, headers=user_auth_headers
+            )
+            assert response.status_code == 200
+            response_data = response.json()
+            seen_uids.extend(item["uid"] for item in response_data["items"])
+            if response_data["next_cursor"] is None:
+                break
+            params["cursor"] = response_data["next_cursor"]
+
+        assert len(seen_uids) == len(set(seen_uids))
+        assert str(user_fixture.uid) in seen_uids
+        assert str(user_fixture_2.uid) in seen_uids
+
     async def test_create_user(
         self,
         http_client: AsyncClient,
@@ -125,6 +238,53 @@ class TestUser:
         )
         assert response.status_code == 204
 
+    async def test_delete_user_invalidates_cached_job_lists(
+        self,
+        http_client: AsyncClient,
+        job_fixture: Job,
+        user_fixture: User,
+        user_fixture_2: User,
+        get_auth_headers: Callable,
+    ):
+        performer_endpoint = "/api/v1/job/performer/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        user_2_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(
+            performer_endpoint, headers=user_2_auth_headers
+        )
+        assert len(response.json()) == 1
+
+        response = await http_client.delete(
+            f"{ROOT_ENDPOINT}{user_fixture.uid}/", headers=user_auth_headers
+        )
+        assert response.status_code == 204
+
+        response = await http_client.get(
+            performer_endpoint, headers=user_2_auth_headers
+        )
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert response.json() == []
+
+    async def test_admin_edit_invalidates_cached_principal(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            ROOT_ENDPOINT, headers=user_auth_headers
+        )
+        assert response.status_code == 200
+        assert principal_cache.local.get(str(user_fixture.uid)) is not None
+
+        await UserAdmin().after_model_change(
+            {"is_admin": True}, user_fixture, False, None
+        )
+
+        assert principal_cache.local.get(str(user_fixture.uid)) is None
+        assert await principal_cache.get(user_fixture.uid) is None
+
     async def test_delete_user_with_wrong_uid(
         self,
         http_client: AsyncClient,
@@ -0,0 +1,236 @@
+import asyncio
+import time
+from contextlib import suppress
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from fastapi_cache import FastAPICache
+from redis import asyncio as aioredis
+
+from cache import (
+    CACHE_COALESCED,
+    CACHE_TIER_REQUESTS,
+    GENERATION_KEY,
+    LOCK_KEY,
+    TAG_KEY,
+    TwoTierBackend,
+    cache,
+    entry_tags,
+)
+from configs.config import redis_settings
+from utilities.metrics import metric_value
+
+KEY = "fastapi-cache::get_author_jobs:user:digest"
+TAG = "jobs:backend"
+
+
+@pytest_asyncio.fixture
+async def redis() -> aioredis.Redis:
+    client = aioredis.from_url(
+        f"redis://{redis_settings.REDIS_HOST}:{redis_settings.REDIS_PORT}"
+    )
+    FastAPICache.reset()
+    FastAPICache.init(TwoTierBackend(client, 10, 10), prefix="fastapi-cache")
+    yield client
+    await client.delete(
+        KEY,
+        LOCK_KEY.format(key=KEY),
+        TAG_KEY.format(prefix="fastapi-cache", tag=TAG),
+        GENERATION_KEY.format(prefix="fastapi-cache", tag=TAG),
+    )
+    FastAPICache.reset()
+    await client.aclose()
+
+
+async def test_hits_are_served_from_l1(redis: aioredis.Redis):
+    backend = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    await backend.set(KEY, b"value", 60)
+    l1_hits = metric_value(CACHE_TIER_REQUESTS, tier="l1", result="hit")
+
+    ttl, value = await backend.get_with_ttl(KEY)
+
+    assert value == b"value"
+    assert 0 < ttl <= 60
+    assert (
+        metric_value(CACHE_TIER_REQUESTS, tier="l1", result="hit")
+        == l1_hits + 1
+    )
+
+
+async def test_redis_hit_fills_l1(redis: aioredis.Redis):
+    writer = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    reader = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    await writer.set(KEY, b"value", 60)
+    redis_hits = metric_value(CACHE_TIER_REQUESTS, tier="redis", result="hit")
+
+    assert (await reader.get_with_ttl(KEY))[1] == b"value"
+    assert (await reader.get_with_ttl(KEY))[1] == b"value"
+    assert (
+        metric_value(CACHE_TIER_REQUESTS, tier="redis", result="hit")
+        == redis_hits + 1
+    )
+
+
+async def test_invalidation_is_broadcast_to_other_workers(
+    redis: aioredis.Redis,
+):
+    writer = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    reader = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    listener = asyncio.create_task(reader.listen())
+    await asyncio.sleep(0.1)
+
+    entry_tags.set(("jobs:all",))
+    await writer.set(KEY, b"value", 60)
+    await reader.get_with_ttl(KEY)
+    assert reader.l1.get(KEY) is not None
+
+    await writer.invalidate_tags(["jobs:all"])
+    await asyncio.sleep(0.1)
+    listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await listener
+
+    assert reader.l1.get(KEY) is None
+    assert (await reader.get_with_ttl(KEY))[1] is None
+
+
+async def test_concurrent_misses_wait_for_one_refill(redis: aioredis.Redis):
+    backend = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    coalesced = metric_value(CACHE_COALESCED, mode="local")
+
+    assert await backend.get_with_ttl(KEY) == (0, None)
+    waiters = [
+        asyncio.create_task(backend.get_with_ttl(KEY)) for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    await backend.set(KEY, b"value", 60)
+
+    assert [value for _, value in await asyncio.gather(*waiters)] == [
+        b"value"
+    ] * 3
+    assert metric_value(CACHE_COALESCED, mode="local") == coalesced + 3
+
+
+async def test_other_process_waits_for_refill(redis: aioredis.Redis):
+    refiller = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    waiter = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+
+    assert (await refiller.get_with_ttl(KEY))[1] is None
+    waiting = asyncio.create_task(waiter.get_with_ttl(KEY))
+    await asyncio.sleep(0.1)
+    assert not waiting.done()
+    await refiller.set(KEY, b"value", 60)
+
+    assert (await waiting)[1] == b"value"
+
+
+# Redis rounds the remaining TTL, so 1.1 s past expiry reads as exactly
+# stale_ttl left and 1.7 s as one second into the stale window
+@pytest.mark.parametrize("delay", [1.1, 1.7])
+async def test_expired_entry_is_served_stale_during_refill(
+    redis: aioredis.Redis, delay: float
+):
+    refiller = TwoTierBackend(redis, l1_size=10, l1_ttl=1, stale_ttl=30)
+    other = TwoTierBackend(redis, l1_size=10, l1_ttl=1, stale_ttl=30)
+    await refiller.set(KEY, b"old", 1)
+    await asyncio.sleep(delay)
+    stale = metric_value(CACHE_COALESCED, mode="stale")
+
+    assert await refiller.get_with_ttl(KEY) == (0, None)
+    assert await redis.exists(LOCK_KEY.format(key=KEY))
+    assert await other.get_with_ttl(KEY) == (0, b"old")
+    assert other.l1.get(KEY) is None
+    assert metric_value(CACHE_COALESCED, mode="stale") == stale + 1
+
+    await refiller.set(KEY, b"new", 60)
+    assert (await other.get_with_ttl(KEY))[1] == b"new"
+
+
+async def test_failed_refill_is_released(redis: aioredis.Redis):
+    release = asyncio.Event()
+    calls = []
+
+    @cache(expire=60, key_builder=lambda *_, **__: KEY)
+    async def endpoint() -> str:
+        calls.append(None)
+        if len(calls) == 1:
+            await release.wait()
+            msg = "query failed"
+            raise ValueError(msg)
+        return "value"
+
+    failing = asyncio.create_task(endpoint())
+    await asyncio.sleep(0.05)
+    waiting = asyncio.create_task(endpoint())
+    await asyncio.sleep(0.05)
+    release.set()
+    with pytest.raises(ValueError, match="query failed"):
+        await failing
+    start = time.perf_counter()
+
+    assert await waiting == "value"
+    assert time.perf_counter() - start < 1
+    assert len(calls) == 2
+
+
+async def test_other_process_stops_waiting_for_released_refill(
+    redis: aioredis.Redis,
+):
+    refiller = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+    waiter = TwoTierBackend(redis, l1_size=10, l1_ttl=10)
+
+    assert (await refiller.get_with_ttl(KEY))[1] is None
+    waiting = asyncio.create_task(waiter.get_with_ttl(KEY))
+    await asyncio.sleep(0.1)
+    await refiller.release(KEY)
+    start = time.perf_counter()
+
+    assert await waiting == (0, None)
+    assert time.perf_counter() - start < 1
+    assert not await redis.exists(LOCK_KEY.format(key=KEY))
+
+
+def tagged_key(*_: Any, **__: Any) -> str:
+    entry_tags.set((TAG,))
+    return KEY
+
+
+async def test_refill_started_before_invalidation_is_not_stored(
+    redis: aioredis.Redis,
+):
+    rows = ["old"]
+    read, release = asyncio.Event(), asyncio.Event()
+
+    @cache(expire=60, key_builder=tagged_key)
+    async def endpoint() -> str:
+        value = rows[0]
+        read.set()
+        await release.wait()
+        return value
+
+    slow_refill = asyncio.create_task(endpoint())
+    await read.wait()
+    rows[0] = "new"
+    await FastAPICache.get_backend().invalidate_tags([TAG])
+    release.set()
+
+    assert await slow_refill == "old"
+    assert not await redis.exists(KEY)
+    assert not await redis.exists(LOCK_KEY.format(key=KEY))
+    assert await endpoint() == "new"
+    rows[0] = "newer"
+    assert await endpoint() == "new"
+
+
+async def test_refill_right_after_invalidation_expires_early(
+    redis: aioredis.Redis,
+):
+    backend = TwoTierBackend(redis, l1_size=10, l1_ttl=10, settle_ttl=2)
+    await backend.invalidate_tags([TAG])
+
+    entry_tags.set((TAG,))
+    assert await backend.get_with_ttl(KEY) == (0, None)
+    await backend.set(KEY, b"value", 60)
+
+    assert 0 < await redis.ttl(KEY) <= 2
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from contextlib import suppress
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi_cache import FastAPICache
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from cache import CACHE_REQUESTS, TwoTierBackend, entry_tags, key_endpoint
+from models import User
+from security.principal_cache import PRINCIPAL_KEY, PrincipalCache
+from utilities.circuit_breaker import CIRCUIT_BREAKER_STATE, CircuitBreaker
+from utilities.exceptions import CircuitOpenError
+from utilities.metrics import metric_value
+
+from tests.fixtures.redis import FaultyRedis
+
+KEY = "fastapi-cache::get_author_jobs:breaker:digest"
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def cache(faulty_redis: FaultyRedis) -> None:
+    FastAPICache.reset()
+    FastAPICache.init(
+        TwoTierBackend(faulty_redis, 10, 10), prefix="fastapi-cache"
+    )
+    yield
+    FastAPICache.reset()
+
+
+def make_breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(
+        name, failure_threshold=2, timeout=0.05, probe_interval=0.01
+    )
+
+
+async def test_slow_calls_trip_the_breaker(faulty_redis: FaultyRedis):
+    breaker = make_breaker("slow")
+    faulty_redis.delay = 1
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            await breaker.call(faulty_redis.get, KEY)
+
+    assert breaker.is_open
+    assert metric_value(CIRCUIT_BREAKER_STATE, breaker="slow") == 1
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(faulty_redis.get, KEY)
+
+
+async def test_success_resets_consecutive_failures(
+    faulty_redis: FaultyRedis,
+):
+    breaker = make_breaker("flaky")
+    faulty_redis.down = True
+    with pytest.raises(RedisConnectionError):
+        await breaker.call(faulty_redis.get, KEY)
+    faulty_redis.down = False
+    await breaker.call(faulty_redis.get, KEY)
+    faulty_redis.down = True
+    with pytest.raises(RedisConnectionError):
+        await breaker.call(faulty_redis.get, KEY)
+
+    assert not breaker.is_open
+
+
+async def test_watch_closes_once_redis_answers(faulty_redis: FaultyRedis):
+    breaker = make_breaker("recovery")
+    recovered = asyncio.Event()
+
+    async def on_recovery() -> None:
+        recovered.set()
+
+    faulty_redis.down = True
+    breaker.trip()
+    watcher = asyncio.create_task(
+        breaker.watch(faulty_redis.ping, retry=[on_recovery])
+    )
+    await asyncio.sleep(0.05)
+    assert breaker.is_open
+
+    faulty_redis.down = False
+    await asyncio.wait_for(recovered.wait(), 1)
+    await asyncio.sleep(0.05)
+    assert not watcher.done()
+    watcher.cancel()
+    with suppress(asyncio.CancelledError):
+        await watcher
+
+    assert not breaker.is_open
+    assert metric_value(CIRCUIT_BREAKER_STATE, breaker="recovery") == 0
+
+
+async def test_slow_redis_is_bypassed(faulty_redis: FaultyRedis):
+    backend = TwoTierBackend(
+        faulty_redis, l1_size=10, l1_ttl=10, breaker=make_breaker("cache")
+    )
+    endpoint = key_endpoint(KEY)
+    bypassed = metric_value(CACHE_REQUESTS, endpoint=endpoint, result="bypass")
+    faulty_redis.delay = 1
+
+    start = time.perf_counter()
+    for _ in range(3):
+        assert await backend.get_with_ttl(KEY) == (0, None)
+        await backend.set(KEY, b"value", 60)
+
+    assert time.perf_counter() - start < 0.5
+    assert backend.breaker.is_open
+    assert backend.l1.get(KEY) is None
+    assert (
+        metric_value(CACHE_REQUESTS, endpoint=endpoint, result="bypass")
+        == bypassed + 3
+    )
+
+
+async def test_invalidations_are_replayed_after_recovery(
+    faulty_redis: FaultyRedis,
+):
+    backend = TwoTierBackend(
+        faulty_redis, l1_size=10, l1_ttl=10, breaker=make_breaker("replay")
+    )
+    entry_tags.set(("jobs:breaker",))
+    await backend.set(KEY, b"value", 60)
+    faulty_redis.down = True
+
+    with pytest.raises(RedisConnectionError):
+        await backend.invalidate_tags(["jobs:breaker"])
+    assert backend.l1.get(KEY) is None
+    assert backend.pending_tags == {"jobs:breaker"}
+
+    faulty_redis.down = False
+    await backend.replay_invalidations()
+
+    assert backend.pending_tags == set()
+    assert await faulty_redis.get(KEY) is None
+
+
+async def test_failure_that_does_not_trip_is_still_replayed(
+    faulty_redis: FaultyRedis,
+):
+    breaker = make_breaker("retry")
+    backend = TwoTierBackend(
+        faulty_redis, l1_size=10, l1_ttl=10, breaker=breaker
+    )
+    principals = PrincipalCache(maxsize=10, ttl=10, redis_ttl=10)
+    principals.init(faulty_redis, breaker)
+    user_uid = uuid4()
+    principal_key = PRINCIPAL_KEY.format(user_uid=user_uid)
+    entry_tags.set(("jobs:breaker",))
+    await backend.set(KEY, b"value", 60)
+    await faulty_redis.set(principal_key, b"{}", ex=10)
+
+    faulty_redis.down = True
+    with pytest.raises(RedisConnectionError):
+        await backend.invalidate_tags(["jobs:breaker"])
+    faulty_redis.down = False
+    await breaker.call(faulty_redis.ping)
+    faulty_redis.down = True
+    await principals.invalidate(user_uid)
+    faulty_redis.down = False
+    assert not breaker.is_open
+
+    watcher = asyncio.create_task(
+        breaker.watch(
+            faulty_redis.ping,
+            retry=[
+                backend.replay_invalidations,
+                principals.replay_invalidations,
+            ],
+        )
+    )
+    await asyncio.sleep(0.1)
+    watcher.cancel()
+    with suppress(asyncio.CancelledError):
+        await watcher
+
+    assert backend.pending_tags == set()
+    assert principals.pending == set()
+    assert await faulty_redis.get(KEY) is None
+    assert await faulty_redis.get(principal_key) is None
+
+
+async def test_principal_lookups_fall_back_to_the_database(
+    faulty_redis: FaultyRedis,
+):
+    principals = PrincipalCache(maxsize=10, ttl=10, redis_ttl=10)
+    principals.init(faulty_redis, make_breaker("principal"))
+    user_uid = uuid4()
+    faulty_redis.down = True
+
+    assert await principals.get(user_uid) is None
+    await principals.invalidate(user_uid)
+    assert principals.pending == {str(user_uid)}
+
+    faulty_redis.down = False
+    principals.breaker.close()
+    await principals.replay_invalidations()
+    assert principals.pending == set()
+
+
+async def test_invalidation_during_a_lookup_is_not_overwritten(
+    faulty_redis: FaultyRedis,
+):
+    principals = PrincipalCache(maxsize=10, ttl=10, redis_ttl=10)
+    principals.init(faulty_redis, make_breaker("principal-race"))
+    user = User(
+        id=1,
+        uid=uuid4(),
+        first_name="user",
+        second_name="user",
+        username="user",
+        email="user@gmail.com",
+        is_admin=False,
+        is_deleted=False,
+        registered_at=datetime.now(UTC),
+    )
+
+    assert await principals.get(user.uid) is None
+    # The user changes while the lookup reads the database
+    await principals.invalidate(user.uid)
+    await principals.set(user)
+
+    assert principals.local.get(str(user.uid)) is None
+    assert (
+        await faulty_redis.get(PRINCIPAL_KEY.format(user_uid=user.uid)) is None
+    )
+
+    assert await principals.get(user.uid) is None
+    await principals.set(user)
+    assert (await principals.get(user.uid)).uid == user.uid
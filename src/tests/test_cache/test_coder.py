@@ -0,0 +1,76 @@
+import uuid
+from datetime import UTC, datetime
+from typing import List
+
+import pytest
+from fastapi_cache.coder import JsonCoder
+
+from cache import CODEC_HEADERS, compact_coder
+from schemas.job import JobResponse
+
+
+def job_response(description: str) -> JobResponse:
+    now = datetime.now(UTC)
+    return JobResponse(
+        uid=uuid.uuid4(),
+        title="title",
+        description=description,
+        performer_id=1,
+        author_id=2,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_small_entries_are_stored_uncompressed():
+    coder = compact_coder(List[JobResponse], threshold=1024)
+    jobs = [job_response("short")]
+
+    encoded = coder.encode(jobs)
+
+    assert encoded[:1] == CODEC_HEADERS["none"]
+    decoded = coder.decode(encoded)
+    assert [JobResponse.model_validate(job) for job in decoded] == jobs
+
+
+def test_large_entries_are_compressed():
+    coder = compact_coder(List[JobResponse], threshold=1024)
+    jobs = [job_response("description " * 50) for _ in range(20)]
+
+    encoded = coder.encode(jobs)
+
+    assert encoded[:1] == CODEC_HEADERS["zlib"]
+    assert len(encoded) < len(JsonCoder.encode(jobs)) / 5
+    decoded = coder.decode(encoded)
+    assert [JobResponse.model_validate(job) for job in decoded] == jobs
+
+
+def test_only_response_model_fields_are_stored():
+    coder = compact_coder(List[JobResponse], compression="none")
+    job = job_response("description").model_dump()
+
+    decoded = coder.decode(coder.encode([{**job, "hashed_password": "x"}]))
+
+    assert "hashed_password" not in decoded[0]
+
+
+def test_json_coder_entries_still_decode():
+    coder = compact_coder(List[JobResponse])
+
+    assert coder.decode(JsonCoder.encode([{"title": "title"}])) == [
+        {"title": "title"}
+    ]
+
+
+def test_unknown_compression_is_rejected():
+    with pytest.raises(ValueError, match="Unknown cache compression"):
+        compact_coder(compression="brotli")
+
+
+def test_hits_are_validated_into_response_models():
+    coder = compact_coder(List[JobResponse])
+    jobs = [job_response("description " * 50) for _ in range(20)]
+
+    decoded = coder.decode_as_type(coder.encode(jobs), type_=None)
+
+    assert decoded == jobs
@@ -0,0 +1,40 @@
+import pytest
+
+from configs.config import db_settings
+from databases.pool import pool_budget
+
+
+@pytest.mark.parametrize(
+    ("budget", "processes", "expected"),
+    [
+        (None, 8, (70, 10)),
+        (100, 1, (90, 10)),
+        (100, 4, (20, 5)),
+        (90, 9, (8, 2)),
+        (8, 8, (1, 0)),
+    ],
+)
+def test_pool_budget(budget: int, processes: int, expected: tuple):
+    settings = db_settings.model_copy(
+        update={
+            "POSTGRES_POOL_SIZE": 70,
+            "POSTGRES_MAX_OVERFLOW": 10,
+            "POSTGRES_CONNECTION_BUDGET": budget,
+            "POSTGRES_POOL_PROCESSES": processes,
+        }
+    )
+    pool_size, max_overflow = pool_budget(settings)
+    assert (pool_size, max_overflow) == expected
+    if budget:
+        assert (pool_size + max_overflow) * processes <= budget
+
+
+def test_pool_budget_too_small_for_processes():
+    settings = db_settings.model_copy(
+        update={
+            "POSTGRES_CONNECTION_BUDGET": 3,
+            "POSTGRES_POOL_PROCESSES": 8,
+        }
+    )
+    with pytest.raises(ValueError, match="POSTGRES_CONNECTION_BUDGET=3"):
+        pool_budget(settings)
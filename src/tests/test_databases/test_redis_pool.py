@@ -0,0 +1,53 @@
+from configs.config import redis_settings
+from databases.redis_pool import (
+    REDIS_COMMAND_SECONDS,
+    RedisConnectionManager,
+)
+from utilities.metrics import metric_value
+
+KEY = "redis-pool-test"
+
+
+async def test_commands_and_pipelines_are_timed():
+    manager = RedisConnectionManager(redis_settings)
+    redis = manager.connect()
+    gets = metric_value(REDIS_COMMAND_SECONDS, "_count", command="GET")
+    pipelines = metric_value(
+        REDIS_COMMAND_SECONDS, "_count", command="PIPELINE"
+    )
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(KEY, "value", ex=10)
+            pipe.get(KEY)
+            await pipe.execute()
+
+        assert await redis.get(KEY) == b"value"
+        assert (
+            metric_value(REDIS_COMMAND_SECONDS, "_count", command="GET")
+            == gets + 1
+        )
+        assert metric_value(
+            REDIS_COMMAND_SECONDS, "_count", command="PIPELINE"
+        ) == (pipelines + 1)
+        assert manager.idle_connections() == 1
+        assert manager.in_use_connections() == 0
+    finally:
+        await redis.delete(KEY)
+        await manager.close()
+
+    assert manager.idle_connections() == 0
+
+
+def test_connect_returns_the_shared_client():
+    manager = RedisConnectionManager(redis_settings)
+
+    assert manager.connect() is manager.connect()
+    assert manager.pool.max_connections == redis_settings.REDIS_MAX_CONNECTIONS
+
+
+def test_celery_uses_the_same_redis():
+    options = RedisConnectionManager(redis_settings).celery_options()
+
+    assert options["broker_url"] == redis_settings.url
+    assert options["result_backend"] == redis_settings.url
+    assert f":{redis_settings.REDIS_PORT}/" in redis_settings.url
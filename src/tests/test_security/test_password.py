@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+from security.calibrate import MIN_ROUNDS, calibrate
+from security.password import (
+    PasswordHasher,
+    hash_password,
+    verify_password,
+)
+from utilities.exceptions import PasswordHashQueueFullError
+
+
+async def test_hash_and_verify_password():
+    hashed_password = await hash_password("password")
+    assert await verify_password("password", hashed_password)
+    assert not await verify_password("wrong", hashed_password)
+
+
+async def test_password_hasher_does_not_block_event_loop():
+    hasher = PasswordHasher(workers=1, queue_limit=0)
+    release = threading.Event()
+    task = asyncio.create_task(hasher.run("hash", release.wait, 5))
+    await asyncio.sleep(0.01)
+
+    assert hasher.in_progress == 1
+    release.set()
+    assert await task is True
+    assert hasher.pending == 0
+
+
+async def test_cancelled_caller_keeps_its_slot_until_the_job_ends():
+    hasher = PasswordHasher(workers=1, queue_limit=0)
+    release = threading.Event()
+    task = asyncio.create_task(hasher.run("hash", release.wait, 5))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert hasher.pending == 1
+    with pytest.raises(PasswordHashQueueFullError):
+        await hasher.run("hash", release.wait, 5)
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert hasher.pending == 0
+
+
+async def test_password_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    release = threading.Event()
+    tasks = [
+        asyncio.create_task(hasher.run("hash", release.wait, 5))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    assert hasher.queue_depth == 1
+
+    with pytest.raises(PasswordHashQueueFullError):
+        await hasher.run("hash", release.wait, 5)
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [True, True]
+    assert hasher.queue_depth == 0
+
+
+def test_calibrate_stops_at_first_cost_over_target():
+    rounds, measured = calibrate(target=0, samples=1)
+    assert rounds == MIN_ROUNDS
+    assert [cost for cost, _ in measured] == [MIN_ROUNDS]
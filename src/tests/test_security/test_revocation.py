@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from security.revocation import TokenRevocationList
+from utilities.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [str(uuid4()) for _ in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(str(uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+async def test_refresh_tokens_stay_out_of_the_filter():
+    revocations = TokenRevocationList(
+        capacity=1000,
+        error_rate=0.01,
+        refresh_interval=60,
+        single_use_refresh=True,
+    )
+    assert await revocations.redeem("refresh-jti", expires_in=60)
+    assert not await revocations.redeem("refresh-jti", expires_in=60)
+    await revocations.revoke_refresh("logged-out-jti", expires_in=60)
+    assert not await revocations.redeem("logged-out-jti", expires_in=60)
+
+    assert "refresh-jti" not in revocations.filter
+    assert "logged-out-jti" not in revocations.filter
@@ -0,0 +1,59 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi_jwt.jwt_backends.abstract_backend import BackendException
+
+from security.token import access_security
+from security.token_cache import VerifiedTokenCache
+
+
+class CountingDecoder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, token: str) -> dict:
+        self.calls += 1
+        return access_security.jwt_backend.backend.decode(
+            token, access_security.secret_key
+        )
+
+
+def test_verified_token_is_decoded_once():
+    cache = VerifiedTokenCache("test", maxsize=10, ttl=60)
+    decoder = CountingDecoder()
+    token = access_security.create_access_token(subject={"uid": "1"})
+
+    first = cache.decode(token, decoder)
+    second = cache.decode(token, decoder)
+
+    assert first == second
+    assert first["subject"] == {"uid": "1"}
+    assert decoder.calls == 1
+
+
+def test_token_cache_respects_expiry():
+    cache = VerifiedTokenCache("test", maxsize=10, ttl=60)
+    decoder = CountingDecoder()
+    token = access_security.create_access_token(
+        subject={"uid": "1"}, expires_delta=timedelta(seconds=1)
+    )
+
+    cache.decode(token, decoder)
+    time.sleep(1.1)
+    cache.decode(token, decoder)
+
+    assert decoder.calls == 2
+
+
+def test_invalid_token_is_not_cached():
+    cache = VerifiedTokenCache("test", maxsize=10, ttl=60)
+    decoder = CountingDecoder()
+    token = access_security.create_access_token(subject={"uid": "1"})[:-2]
+
+    for _ in range(2):
+        with pytest.raises(BackendException):
+            cache.decode(token, decoder)
+
+    assert decoder.calls == 2
+    assert len(cache.tokens) == 0
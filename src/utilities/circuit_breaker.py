@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from configs.loggers import logger
+from utilities.exceptions import CircuitOpenError
+from utilities.metrics import Counter, Gauge
+
+T = TypeVar("T")
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_open",
+    "1 while the breaker is open and calls are bypassed, 0 when closed",
+    ["breaker"],
+    multiprocess_mode="livemax",
+)
+CIRCUIT_BREAKER_TRIPS = Counter(
+    "circuit_breaker_trips_total",
+    "Times the breaker opened",
+    ["breaker"],
+)
+CIRCUIT_BREAKER_CALLS = Counter(
+    "circuit_breaker_calls_total",
+    "Calls through the breaker by outcome",
+    ["breaker", "result"],
+)
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency is unhealthy. Every call gets `timeout`
+    seconds; `failure_threshold` failures in a row open the breaker, and
+    calls then raise CircuitOpenError at once until `watch` sees a probe
+    succeed.
+    **Parameters**
+    * `name`: Label of the breaker's metrics
+    * `failure_threshold`: Consecutive failures that open the breaker
+    * `timeout`: Seconds one call may take before it counts as failed
+    * `probe_interval`: Seconds between recovery probes while open
+    * `failures`: Exception types that count as failures
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        timeout: float,
+        probe_interval: float,
+        failures: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.timeout = timeout
+        self.probe_interval = probe_interval
+        self.failures = (*failures, TimeoutError)
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        CIRCUIT_BREAKER_STATE.labels(breaker=name).set(0)
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def trip(self) -> None:
+        if self.is_open:
+            return
+        self.opened_at = time.monotonic()
+        CIRCUIT_BREAKER_STATE.labels(breaker=self.name).set(1)
+        CIRCUIT_BREAKER_TRIPS.labels(breaker=self.name).inc()
+        msg = (
+            f"Circuit breaker {self.name} opened after "
+            f"{self.consecutive_failures} failures"
+        )
+        logger.warning(msg)
+
+    def close(self) -> None:
+        if self.is_open:
+            msg = (
+                f"Circuit breaker {self.name} closed after "
+                f"{time.monotonic() - self.opened_at:.1f}s"
+            )
+            logger.info(msg)
+        self.opened_at = None
+        self.consecutive_failures = 0
+        CIRCUIT_BREAKER_STATE.labels(breaker=self.name).set(0)
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self.trip()
+
+    async def call(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        if self.is_open:
+            CIRCUIT_BREAKER_CALLS.labels(
+                breaker=self.name, result="rejected"
+            ).inc()
+            msg = f"Circuit breaker {self.name} is open"
+            raise CircuitOpenError(msg)
+        try:
+            result = await asyncio.wait_for(
+                func(*args, **kwargs), self.timeout
+            )
+        except self.failures:
+            CIRCUIT_BREAKER_CALLS.labels(
+                breaker=self.name, result="failure"
+            ).inc()
+            self.record_failure()
+            raise
+        CIRCUIT_BREAKER_CALLS.labels(breaker=self.name, result="success").inc()
+        self.consecutive_failures = 0
+        return result
+
+    async def watch(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        retry: Sequence[Callable[[], Awaitable[Any]]] = (),
+    ) -> None:
+        """
+        Every `probe_interval` seconds: while open, call `probe` and close
+        once it succeeds; while closed, run `retry`, which replays work
+        that failed earlier, whether or not it opened the breaker, and
+        should return at once when there is none.
+        Meant to run as a background task until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            if self.is_open:
+                try:
+                    await asyncio.wait_for(probe(), self.timeout)
+                except self.failures:
+                    continue
+                self.close()
+            for callback in retry:
+                try:
+                    await callback()
+                except (CircuitOpenError, *self.failures) as ex:
+                    logger.exception(ex)
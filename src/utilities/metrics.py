@@ -0,0 +1,71 @@
+import os
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.metrics import MetricWrapperBase
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "mark_process_dead",
+    "metric_value",
+    "render_metrics",
+]
+
+# Set for every uvicorn and celery process when several of them serve
+# the app, so that a scrape of any one of them sums up all of them
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_mode() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def render_metrics() -> bytes:
+    """Metrics of this process, or of every process sharing
+    PROMETHEUS_MULTIPROC_DIR, in the Prometheus text format."""
+    if not multiprocess_mode():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drop the live gauges of a stopped process from the shared
+    directory, a no-op with a single process."""
+    if multiprocess_mode():
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def metric_value(
+    metric: MetricWrapperBase, suffix: Optional[str] = None, **labels: str
+) -> float:
+    """
+    Value of one of `metric`'s samples in this process, 0 until it is
+    recorded.
+    **Parameters**
+    * `metric`: Counter, Gauge or Histogram
+    * `suffix`: Sample name suffix, such as `_count` for a Histogram,
+    `_total` for a Counter and none for a Gauge by default
+    * `labels`: Label values of the sample
+    """
+    for family in metric.collect():
+        if suffix is None:
+            suffix = "_total" if family.type == "counter" else ""
+        for sample in family.samples:
+            if sample.name == family.name + suffix and sample.labels == labels:
+                return sample.value
+    return 0.0
@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from utilities.exceptions import InvalidCursorError
+
+
+def encode_cursor(sort_value: Any, obj_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, obj_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: type) -> Tuple[Any, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        sort_value, obj_id = json.loads(base64.urlsafe_b64decode(padded))
+        if sort_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+    except (ValueError, TypeError, binascii.Error) as ex:
+        msg = "Invalid pagination cursor."
+        raise InvalidCursorError(msg) from ex
+
+    if not isinstance(obj_id, int) or not isinstance(sort_value, sort_type):
+        msg = "Invalid pagination cursor."
+        raise InvalidCursorError(msg)
+    return sort_value, obj_id
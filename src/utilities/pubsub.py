@@ -0,0 +1,39 @@
+import asyncio
+from typing import Callable
+
+from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from configs.loggers import logger
+
+RECONNECT_DELAY = 1.0
+# Below the socket timeout, so an idle channel is not a read timeout
+POLL_TIMEOUT = 1.0
+
+
+async def subscribe(
+    redis: aioredis.Redis, channel: str, handler: Callable[[str], None]
+) -> None:
+    """
+    Call `handler` with the payload of every message published to
+    `channel`, resubscribing after connection errors.
+    Meant to run as a background task until cancelled.
+    """
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=POLL_TIMEOUT
+                )
+                if message is not None and message["type"] == "message":
+                    data = message["data"]
+                    handler(data.decode() if isinstance(data, bytes) else data)
+        except (RedisConnectionError, RedisTimeoutError) as ex:
+            msg = f"Lost subscription to {channel}: {ex}"
+            logger.warning(msg)
+            await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            await pubsub.aclose()
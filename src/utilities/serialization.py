@@ -0,0 +1,23 @@
+from functools import cache
+from typing import Any
+
+import orjson
+from pydantic import TypeAdapter
+
+
+class RawJSON(bytes):
+    """A JSON document that is already encoded and is sent as is."""
+
+
+@cache
+def type_adapter(type_: Any) -> TypeAdapter:
+    """Shared TypeAdapter per type, building one compiles its schema."""
+    return TypeAdapter(type_)
+
+
+def dumps_json(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads_json(value: bytes) -> Any:
+    return orjson.loads(value)
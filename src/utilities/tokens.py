@@ -1,6 +1,6 @@
 from datetime import timedelta
-from typing import TypedDict, Union, TypeVar
-from uuid import UUID
+from typing import NotRequired, Optional, TypedDict, Union, TypeVar
+from uuid import UUID, uuid4
 
 from starlette.responses import Response
 
@@ -18,11 +18,18 @@ ResponseT = TypeVar("ResponseT", bound=Response)
 
 class TokenSubject(TypedDict):
     uid: Union[UUID, str]
+    # jti of the refresh token issued along with an access token, so
+    # logout can revoke both
+    refresh_jti: NotRequired[str]
 
 
 async def create_tokens(subject: TokenSubject) -> TokenAccessRefresh:
-    access_token = await create_access_token(subject)
-    refresh_token = await create_refresh_token(subject)
+    subject = TokenSubject(uid=subject["uid"])
+    refresh_jti = str(uuid4())
+    access_token = await create_access_token(
+        TokenSubject(**subject, refresh_jti=refresh_jti)
+    )
+    refresh_token = await create_refresh_token(subject, jti=refresh_jti)
     return TokenAccessRefresh(
         access_token=access_token,
         refresh_token=refresh_token,
@@ -34,12 +41,15 @@ async def create_access_token(subject: TokenSubject) -> str:
     return access_security.create_access_token(subject=subject)
 
 
-async def create_refresh_token(subject: TokenSubject) -> str:
+async def create_refresh_token(
+    subject: TokenSubject, jti: Optional[str] = None
+) -> str:
     return refresh_security.create_refresh_token(
         subject=subject,
         expires_delta=timedelta(
             minutes=jwt_settings.JWT_REFRESH_TOKEN_EXPIRES
         ),
+        unique_identifier=jti,
     )
 
 